@@ -4,26 +4,69 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .gates import GateOperation, SUPPORTED_GATES
-from .persistence import result_to_payload, write_result
+from .persistence import dumps_payload, result_to_payload, write_result
 from .solver import GateSequenceSolver
 from .timeline import render_timeline
 from .state import QuantumState
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional accelerator
+    msgspec = None
+
+
+if msgspec is not None:
+
+    class FixedGate(msgspec.Struct):
+        """Typed shape of a canonical ``fixed_gates`` entry, validated by msgspec in C."""
+
+        step: int
+        gate: str
+        targets: Tuple[int, ...]
+
+
+def _loads(raw: bytes | str) -> dict:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers see one error type.
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=16)
+def _load_config_cached(path: str, mtime_ns: int) -> dict:
+    # Keyed on the modification time so an edited file is re-read; callers must not mutate.
+    return _loads(Path(path).read_bytes())
+
 
 def _load_config(path: str) -> dict:
     if path == "-":
-        return json.load(sys.stdin)
-    return json.loads(Path(path).read_text())
+        # A replaced stdin (tests, embedding callers) may be a text stream without a buffer.
+        stream = getattr(sys.stdin, "buffer", None)
+        return _loads(stream.read() if stream is not None else sys.stdin.read())
+    return _load_config_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _parse_amplitudes_cached(raw: Tuple[Tuple[float, ...], ...]) -> QuantumState:
+    # QuantumState is immutable, so repeated configs can share the parsed instance.
+    return QuantumState.from_real_imag_pairs(raw)
 
 
 def _parse_amplitudes(raw: Sequence[Sequence[float]], label: str) -> QuantumState:
     try:
-        return QuantumState.from_real_imag_pairs(raw)
+        return _parse_amplitudes_cached(tuple(tuple(pair) for pair in raw))
     except ValueError as exc:
         raise ValueError(f"Invalid {label} state: {exc}") from exc
 
@@ -38,6 +81,7 @@ def _parse_gate_list(raw: object, *, field_name: str) -> Optional[List[str]]:
     for gate_name in raw:
         if not isinstance(gate_name, str):
             raise ValueError(f"Entries in '{field_name}' must be gate symbols.")
+        gate_name = sys.intern(gate_name)
         if gate_name not in seen:
             cleaned.append(gate_name)
             seen.add(gate_name)
@@ -46,12 +90,66 @@ def _parse_gate_list(raw: object, *, field_name: str) -> Optional[List[str]]:
     return cleaned
 
 
+def _add_fixed_operation(
+    fixed_operations: Dict[int, GateOperation],
+    *,
+    step: int,
+    gate_name: str,
+    targets: Tuple[int, ...],
+    num_qubits: int,
+) -> None:
+    for target in targets:
+        if target < 0 or target >= num_qubits:
+            raise ValueError(
+                f"Fixed gate '{gate_name}' at step {step} targets qubit {target}, "
+                f"but the solver is configured for {num_qubits} qubits."
+            )
+
+    layer_index = step - 1
+    if layer_index in fixed_operations:
+        raise ValueError(f"Multiple fixed gates defined for step {step}.")
+
+    fixed_operations[layer_index] = GateOperation(gate=SUPPORTED_GATES[gate_name], targets=targets)
+
+
+def _parse_fixed_gates_typed(raw: list, *, num_qubits: int) -> Optional[Dict[int, GateOperation]]:
+    """Validate canonical entries with msgspec; ``None`` defers to the detailed Python checks."""
+
+    try:
+        entries = msgspec.convert(raw, type=List[FixedGate])
+    except msgspec.ValidationError:
+        return None
+
+    fixed_operations: Dict[int, GateOperation] = {}
+    for entry in entries:
+        if entry.step <= 0:
+            raise ValueError(f"Fixed gate step must be positive; received {entry.step}.")
+        gate_name = sys.intern(entry.gate)
+        if gate_name not in SUPPORTED_GATES:
+            raise ValueError(f"Fixed gate '{gate_name}' at step {entry.step} is not supported.")
+        _add_fixed_operation(
+            fixed_operations,
+            step=entry.step,
+            gate_name=gate_name,
+            targets=entry.targets,
+            num_qubits=num_qubits,
+        )
+    return fixed_operations
+
+
 def _parse_fixed_gates(raw: object, *, num_qubits: int) -> Dict[int, GateOperation]:
     if raw is None:
         return {}
     if not isinstance(raw, list):
         raise ValueError("Configuration field 'fixed_gates' must be a list.")
 
+    if msgspec is not None:
+        typed = _parse_fixed_gates_typed(raw, num_qubits=num_qubits)
+        if typed is not None:
+            return typed
+
+    # Entries msgspec rejects (aliases such as 'layer', numeric strings, malformed items) are
+    # handled here, which also produces the precise error messages.
     fixed_operations: Dict[int, GateOperation] = {}
     for index, item in enumerate(raw, start=1):
         if not isinstance(item, dict):
@@ -68,11 +166,11 @@ def _parse_fixed_gates(raw: object, *, num_qubits: int) -> Dict[int, GateOperati
             raise ValueError(f"Fixed gate step at index {index} must be an integer.") from exc
         if step <= 0:
             raise ValueError(f"Fixed gate step must be positive; received {step}.")
-        layer_index = step - 1
 
         gate_name = item.get("gate")
         if not isinstance(gate_name, str):
             raise ValueError(f"Fixed gate at step {step} must specify a gate name.")
+        gate_name = sys.intern(gate_name)
         if gate_name not in SUPPORTED_GATES:
             raise ValueError(f"Fixed gate '{gate_name}' at step {step} is not supported.")
 
@@ -84,18 +182,13 @@ def _parse_fixed_gates(raw: object, *, num_qubits: int) -> Dict[int, GateOperati
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Fixed gate targets at step {step} must be integers.") from exc
 
-        for target in targets:
-            if target < 0 or target >= num_qubits:
-                raise ValueError(
-                    f"Fixed gate '{gate_name}' at step {step} targets qubit {target}, "
-                    f"but the solver is configured for {num_qubits} qubits."
-                )
-
-        if layer_index in fixed_operations:
-            raise ValueError(f"Multiple fixed gates defined for step {step}.")
-
-        operation = GateOperation(gate=SUPPORTED_GATES[gate_name], targets=targets)
-        fixed_operations[layer_index] = operation
+        _add_fixed_operation(
+            fixed_operations,
+            step=step,
+            gate_name=gate_name,
+            targets=targets,
+            num_qubits=num_qubits,
+        )
 
     return fixed_operations
 
@@ -158,8 +251,7 @@ def _print_result(result, num_qubits: int, max_layers: int) -> None:
     print("Final state amplitudes:")
     basis_width = num_qubits
     for index, amplitude in enumerate(result.final_state.amplitudes):
-        basis_label = format(index, f"0{basis_width}b")
-        print(f"  |{basis_label}> = {_format_complex(amplitude)}")
+        print(f"  |{index:0{basis_width}b}> = {_format_complex(amplitude)}")
 
 
 def build_argument_parser() -> argparse.ArgumentParser:
@@ -192,6 +284,21 @@ def build_argument_parser() -> argparse.ArgumentParser:
         "--output",
         help="Persist the solver result JSON to this path. Use '-' for stdout.",
     )
+    parser.add_argument(
+        "--bidirectional",
+        action="store_true",
+        help="Search from both the initial and target states; needs the same gates per layer.",
+    )
+    parser.add_argument(
+        "--include-steps",
+        action="store_true",
+        help="Include the per-layer state trace ('steps') in the persisted result JSON.",
+    )
+    parser.add_argument(
+        "--flat-amplitudes-only",
+        action="store_true",
+        help="Persist amplitudes only as 'flat_amplitudes', dropping the legacy pair list.",
+    )
     return parser
 
 
@@ -266,25 +373,41 @@ def main(argv: Iterable[str] | None = None) -> int:
         layer_gate_allowlists=layer_gate_constraints,
         default_layer_gate_allowlist=global_layer_gates,
     )
-    result = solver.solve(initial_state, target_state, max_layers=max_layers)
+    if args.bidirectional and (fixed_gates or layer_gate_constraints):
+        raise SystemExit(
+            "--bidirectional cannot be combined with 'fixed_gates' or per-layer gate constraints."
+        )
+    result = solver.solve(
+        initial_state, target_state, max_layers=max_layers, bidirectional=args.bidirectional
+    )
     _print_result(result, num_qubits=num_qubits, max_layers=max_layers)
     if args.timeline:
         print()
-        timeline = render_timeline(
+        render_timeline(
             initial_state,
             result.sequence,
             intermediate_states=result.states,
             final_state=result.final_state,
+            out=sys.stdout,
         )
-        print(timeline)
+        print()
     output_path = args.output if args.output is not None else config.get("output_path")
     if output_path:
-        payload = result_to_payload(result)
         if output_path == "-":
-            json.dump(payload, sys.stdout, indent=2)
+            payload = result_to_payload(
+                result,
+                include_steps=args.include_steps,
+                legacy=not args.flat_amplitudes_only,
+            )
+            sys.stdout.write(dumps_payload(payload).decode("utf-8"))
             sys.stdout.write("\n")
         else:
-            write_result(result, output_path)
+            write_result(
+                result,
+                output_path,
+                include_steps=args.include_steps,
+                legacy=not args.flat_amplitudes_only,
+            )
             print(f"Persisted result to {output_path}")
     return 0 if result.success else 1
 
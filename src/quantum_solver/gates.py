@@ -4,39 +4,44 @@ from __future__ import annotations
 
 import cmath
 import math
+import sys
 from dataclasses import dataclass
-from typing import Iterable, Sequence, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 
-Matrix = Tuple[Tuple[complex, ...], ...]
+from .gates_cupy import apply_gate_device, is_device_array
+from .gates_numba import NUMBA_AVAILABLE, apply_small_gate
+from .kernels import Kernel, specialised_kernel
+
+
+Matrix = np.ndarray
 
 
 def _is_unitary(matrix: Matrix, *, tolerance: float = 1e-9) -> bool:
-    size = len(matrix)
-    for row in matrix:
-        if len(row) != size:
-            return False
-    for i in range(size):
-        for j in range(size):
-            total = 0j
-            for k in range(size):
-                total += matrix[i][k] * matrix[j][k].conjugate()
-            if i == j:
-                if not math.isclose(total.real, 1.0, rel_tol=tolerance, abs_tol=tolerance):
-                    return False
-                if not math.isclose(total.imag, 0.0, abs_tol=tolerance):
-                    return False
-            else:
-                if not math.isclose(total.real, 0.0, abs_tol=tolerance):
-                    return False
-                if not math.isclose(total.imag, 0.0, abs_tol=tolerance):
-                    return False
-    return True
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        return False
+    identity = np.eye(matrix.shape[0])
+    return bool(np.allclose(matrix.conj().T @ matrix, identity, rtol=tolerance, atol=tolerance))
 
 
-@dataclass(frozen=True)
+def _permutation_of(array: np.ndarray) -> Optional[Tuple[int, ...]]:
+    """Source column for each row if ``array`` is a permutation matrix, otherwise ``None``."""
+
+    ones = array == 1
+    if not np.all(ones | (array == 0)) or not np.all(ones.sum(axis=1) == 1):
+        return None
+    return tuple(int(column) for column in ones.argmax(axis=1))
+
+
+@dataclass(frozen=True, eq=False)
 class Gate:
-    """Unitary matrix describing a quantum gate."""
+    """Unitary matrix describing a quantum gate.
+
+    ``matrix`` accepts any square array-like and is stored as a read-only ``complex128`` array.
+    """
 
     name: str
     matrix: Matrix
@@ -44,14 +49,44 @@ class Gate:
 
     def __post_init__(self) -> None:
         expected = 2**self.num_qubits
-        if len(self.matrix) != expected:
-            raise ValueError(
-                f"Gate {self.name} expects {expected} rows, received {len(self.matrix)} instead."
-            )
-        if not all(len(row) == expected for row in self.matrix):
+        try:
+            matrix = np.array(self.matrix, dtype=np.complex128)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Gate {self.name} matrix must be square.") from exc
+        rows = matrix.shape[0] if matrix.ndim else 0
+        if rows != expected:
+            raise ValueError(f"Gate {self.name} expects {expected} rows, received {rows} instead.")
+        if matrix.shape != (expected, expected):
             raise ValueError(f"Gate {self.name} matrix must be square.")
-        if not _is_unitary(self.matrix):
+        if not _is_unitary(matrix):
             raise ValueError(f"Gate {self.name} matrix is not unitary within tolerance.")
+        matrix.setflags(write=False)
+        object.__setattr__(self, "matrix", matrix)
+        object.__setattr__(self, "_hash", hash((self.name, self.num_qubits, matrix.tobytes())))
+        # Real matrices (X, Z, H, CNOT, ...) act on the real and imaginary parts independently,
+        # so kernels can run on the float64 view of the state and skip complex arithmetic.
+        object.__setattr__(self, "_is_real", not matrix.imag.any())
+        object.__setattr__(self, "_permutation", _permutation_of(matrix))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Gate):
+            return NotImplemented
+        return self is other or (
+            self.name == other.name
+            and self.num_qubits == other.num_qubits
+            and bool(np.array_equal(self.matrix, other.matrix))
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def adjoint(self) -> "Gate":
+        """Inverse gate; self-inverse gates such as H, X and CNOT return themselves."""
+
+        matrix = self.matrix.conj().T
+        if np.array_equal(matrix, self.matrix):
+            return self
+        return Gate(name=f"{self.name}†", matrix=matrix, num_qubits=self.num_qubits)
 
 
 @dataclass(frozen=True)
@@ -69,16 +104,76 @@ class GateOperation:
             )
         if len(set(self.targets)) != len(self.targets):
             raise ValueError("Target qubits must be unique for a gate operation.")
+        # Placement facts that do not depend on the state are computed once per operation.
+        object.__setattr__(self, "targets", tuple(self.targets))
+        object.__setattr__(self, "_lowest_target", min(self.targets))
+        object.__setattr__(self, "_highest_target", max(self.targets))
+        object.__setattr__(self, "_kernels", {})
+
+    def apply(self, state: np.ndarray, num_qubits: int) -> np.ndarray:
+        """Apply the gate operation to a flat state vector.
 
-    def apply(self, state: Tuple[complex, ...], num_qubits: int) -> Tuple[complex, ...]:
-        """Apply the gate operation to a flat state vector."""
+        A CuPy state vector stays on its device and runs the CuPy one- and two-qubit kernels.
+        """
 
         if len(state) != 2**num_qubits:
             raise ValueError(
                 f"State length {len(state)} does not match expected dimension 2**{num_qubits}."
             )
+        if is_device_array(state):
+            if self._lowest_target < 0 or self._highest_target >= num_qubits:
+                raise ValueError(f"Targets {self.targets} are invalid for {num_qubits} qubits.")
+            return apply_gate_device(state, self.gate, self.targets, num_qubits)
+
+        return self._kernel(num_qubits)(_as_state_array(state))
+
+    def apply_batch(self, states: np.ndarray, num_qubits: int) -> np.ndarray:
+        """Apply the gate operation to every row of a ``(batch, 2**num_qubits)`` array."""
+
+        if states.ndim != 2 or states.shape[1] != 2**num_qubits:
+            raise ValueError(
+                f"State batch shape {states.shape} does not match (batch, 2**{num_qubits})."
+            )
+        return self._kernel(num_qubits)(_as_state_array(states))
 
-        return apply_gate_matrix(state, self.gate.matrix, self.targets, num_qubits)
+    def apply_into(self, state: np.ndarray, out: np.ndarray, num_qubits: int) -> np.ndarray:
+        """Apply the operation to a state or batch of states, writing the result into ``out``.
+
+        ``out`` must be a C-contiguous array of the state's shape and complex dtype that does not
+        overlap ``state``; it is returned for convenience.
+        """
+
+        if state.shape[-1] != 2**num_qubits:
+            raise ValueError(
+                f"State length {state.shape[-1]} does not match expected dimension 2**{num_qubits}."
+            )
+        vector = _as_state_array(state)
+        if out.shape != vector.shape or out.dtype != vector.dtype:
+            raise ValueError(
+                f"Output array {out.dtype}{out.shape} does not match state "
+                f"{vector.dtype}{vector.shape}."
+            )
+        if not out.flags.c_contiguous or not out.flags.writeable:
+            raise ValueError("Output array must be writable and C-contiguous.")
+        if np.shares_memory(vector, out):
+            raise ValueError("Output array must not overlap the input state.")
+        return self._kernel(num_qubits)(vector, out)
+
+    def unitary(self, num_qubits: int) -> np.ndarray:
+        """Dense ``2**num_qubits`` square unitary of this placement on the full register."""
+
+        identity = np.eye(2**num_qubits, dtype=np.complex128)
+        # Row j of a batched apply on the identity is U e_j, so the kernel returns U^T.
+        return self.apply_batch(identity, num_qubits).T
+
+    def _kernel(self, num_qubits: int) -> Kernel:
+        kernel = self._kernels.get(num_qubits)
+        if kernel is None:
+            if self._lowest_target < 0 or self._highest_target >= num_qubits:
+                raise ValueError(f"Targets {self.targets} are invalid for {num_qubits} qubits.")
+            kernel = specialised_kernel(self.gate, self.targets, num_qubits)
+            self._kernels[num_qubits] = kernel
+        return kernel
 
     def describe(self) -> str:
         if self.gate.num_qubits == 1:
@@ -92,56 +187,83 @@ class GateOperation:
         return self.describe()
 
 
-def apply_gate_matrix(
-    state: Tuple[complex, ...], gate_matrix: Matrix, targets: Sequence[int], num_qubits: int
-) -> Tuple[complex, ...]:
-    """Apply a gate matrix to the provided state vector."""
+def _as_state_array(state: np.ndarray, dtype: np.dtype | type | None = None) -> np.ndarray:
+    """Contiguous complex view of ``state``; complex64 input keeps its precision by default."""
 
-    targets = tuple(targets)
+    if dtype is None:
+        dtype = state.dtype if getattr(state, "dtype", None) == np.complex64 else np.complex128
+    return np.ascontiguousarray(state, dtype=dtype)
+
+
+def _check_targets(targets: Tuple[int, ...], num_qubits: int) -> None:
     if any(q < 0 or q >= num_qubits for q in targets):
         raise ValueError(f"Targets {targets} are invalid for {num_qubits} qubits.")
 
-    dimension = 1 << num_qubits
-    result = [0j] * dimension
-    target_mask = 0
-    for qubit in targets:
-        target_mask |= 1 << qubit
 
-    block_size = 1 << len(targets)
-    reversed_targets = tuple(reversed(targets))
+@lru_cache(maxsize=None)
+def _contraction_axes(
+    targets: Tuple[int, ...], num_qubits: int
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """Return gate-input, state, and gate-output axes for contracting a gate onto ``targets``.
 
-    for base_index in range(dimension):
-        if base_index & target_mask:
-            continue
-        indices = []
-        for pattern in range(block_size):
-            idx = base_index
-            for offset, qubit in enumerate(reversed_targets):
-                if (pattern >> offset) & 1:
-                    idx |= 1 << qubit
-            indices.append(idx)
+    The tables depend only on the placement, not on the state, so they are built once per
+    ``(targets, num_qubits)`` pair.
+    """
 
-        vector = [state[idx] for idx in indices]
-        transformed = []
-        for row in gate_matrix:
-            total = 0j
-            for coefficient, amplitude in zip(row, vector):
-                total += coefficient * amplitude
-            transformed.append(total)
+    _check_targets(targets, num_qubits)
+    arity = len(targets)
+    state_axes = tuple(num_qubits - 1 - qubit for qubit in targets)
+    return tuple(range(arity, 2 * arity)), state_axes, tuple(range(arity))
 
-        for idx, value in zip(indices, transformed):
-            result[idx] = value
 
-    return tuple(result)
+def apply_gate_matrix(
+    state: np.ndarray,
+    gate_matrix: Matrix | Sequence[Sequence[complex]],
+    targets: Sequence[int],
+    num_qubits: int,
+    *,
+    dtype: np.dtype | type | None = None,
+) -> np.ndarray:
+    """Apply a gate matrix to the provided state vector.
+
+    One- and two-qubit matrices run on the compiled Numba kernels when numba is installed.
+    Otherwise the state is viewed as a rank-``num_qubits`` tensor and the gate is contracted
+    against the target axes in a single ``tensordot`` call. Qubit ``q`` corresponds to bit
+    ``1 << q`` of the basis index, which is tensor axis ``num_qubits - 1 - q`` in C order. Real
+    gate matrices are contracted against the interleaved real view of the state, carrying the
+    real/imaginary pair along as a trailing axis. ``dtype`` selects ``complex128`` or
+    ``complex64`` arithmetic and defaults to the precision of ``state``.
+    """
+
+    targets = tuple(targets)
+    gate_axes, state_axes, output_axes = _contraction_axes(targets, num_qubits)
+
+    arity = len(targets)
+    matrix = np.asarray(gate_matrix)
+    vector = _as_state_array(np.asarray(state), dtype)
+    real_dtype = vector.real.dtype
+    if NUMBA_AVAILABLE and arity <= 2:
+        matrix_dtype = np.float64 if np.isrealobj(matrix) else np.complex128
+        square = np.ascontiguousarray(matrix, dtype=matrix_dtype).reshape(1 << arity, 1 << arity)
+        return apply_small_gate(vector, square, targets, num_qubits)
+    if np.isrealobj(matrix):
+        tensor = matrix.astype(real_dtype, copy=False).reshape((2,) * (2 * arity))
+        psi = vector.view(real_dtype).reshape((2,) * num_qubits + (2,))
+    else:
+        tensor = matrix.astype(vector.dtype, copy=False).reshape((2,) * (2 * arity))
+        psi = vector.reshape((2,) * num_qubits)
+    contracted = np.tensordot(tensor, psi, axes=(gate_axes, state_axes))
+    result = np.moveaxis(contracted, output_axes, state_axes).reshape(-1)
+    return result.view(vector.dtype) if result.dtype == real_dtype else result
 
 
 def _create_single_qubit_gate(name: str, matrix: Iterable[Iterable[complex]]) -> Gate:
-    mat = tuple(tuple(complex(value) for value in row) for row in matrix)
+    mat = np.asarray([list(row) for row in matrix], dtype=np.complex128)
     return Gate(name=name, matrix=mat, num_qubits=1)
 
 
 def _create_two_qubit_gate(name: str, matrix: Iterable[Iterable[complex]]) -> Gate:
-    mat = tuple(tuple(complex(value) for value in row) for row in matrix)
+    mat = np.asarray([list(row) for row in matrix], dtype=np.complex128)
     return Gate(name=name, matrix=mat, num_qubits=2)
 
 
@@ -221,7 +343,9 @@ CNOT_GATE = _create_two_qubit_gate(
     ],
 )
 
-SUPPORTED_GATES = {
-    gate.name: gate
-    for gate in (X_GATE, Y_GATE, Z_GATE, H_GATE, S_GATE, SX_GATE, T_GATE, ID_GATE, CNOT_GATE)
-}
+SUPPORTED_GATES: Mapping[str, Gate] = MappingProxyType(
+    {
+        sys.intern(gate.name): gate
+        for gate in (X_GATE, Y_GATE, Z_GATE, H_GATE, S_GATE, SX_GATE, T_GATE, ID_GATE, CNOT_GATE)
+    }
+)
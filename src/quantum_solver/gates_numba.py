@@ -0,0 +1,145 @@
+"""Optional Numba kernels for applying one- and two-qubit gates to state vectors."""
+
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def apply_1q(state, out, m00, m01, m10, m11, target, num_qubits):
+        """Apply a 2x2 matrix to ``target`` into ``out``, streaming over amplitude pairs."""
+
+        low_mask = (1 << target) - 1
+        stride = 1 << target
+        for i in prange(1 << (num_qubits - 1)):
+            lo = ((i >> target) << (target + 1)) | (i & low_mask)
+            hi = lo | stride
+            a = state[lo]
+            b = state[hi]
+            out[lo] = m00 * a + m01 * b
+            out[hi] = m10 * a + m11 * b
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def apply_2q(state, out, matrix, first, second, num_qubits):
+        """Apply a 4x4 matrix to ``(first, second)`` into ``out``; ``first`` is the high row bit."""
+
+        low = min(first, second)
+        high = max(first, second)
+        first_bit = 1 << first
+        second_bit = 1 << second
+        for i in prange(1 << (num_qubits - 2)):
+            base = ((i >> low) << (low + 1)) | (i & ((1 << low) - 1))
+            base = ((base >> high) << (high + 1)) | (base & ((1 << high) - 1))
+            i00 = base
+            i01 = base | second_bit
+            i10 = base | first_bit
+            i11 = i01 | first_bit
+            a0 = state[i00]
+            a1 = state[i01]
+            a2 = state[i10]
+            a3 = state[i11]
+            out[i00] = matrix[0, 0] * a0 + matrix[0, 1] * a1 + matrix[0, 2] * a2 + matrix[0, 3] * a3
+            out[i01] = matrix[1, 0] * a0 + matrix[1, 1] * a1 + matrix[1, 2] * a2 + matrix[1, 3] * a3
+            out[i10] = matrix[2, 0] * a0 + matrix[2, 1] * a1 + matrix[2, 2] * a2 + matrix[2, 3] * a3
+            out[i11] = matrix[3, 0] * a0 + matrix[3, 1] * a1 + matrix[3, 2] * a2 + matrix[3, 3] * a3
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def apply_1q_real(pairs, out, m00, m01, m10, m11, target, num_qubits):
+        """Real-matrix variant of :func:`apply_1q` over ``(re, im)`` rows of a float64 buffer."""
+
+        low_mask = (1 << target) - 1
+        stride = 1 << target
+        for i in prange(1 << (num_qubits - 1)):
+            lo = ((i >> target) << (target + 1)) | (i & low_mask)
+            hi = lo | stride
+            for part in range(2):
+                a = pairs[lo, part]
+                b = pairs[hi, part]
+                out[lo, part] = m00 * a + m01 * b
+                out[hi, part] = m10 * a + m11 * b
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def apply_2q_real(pairs, out, matrix, first, second, num_qubits):
+        """Real-matrix variant of :func:`apply_2q` over ``(re, im)`` rows of a float64 buffer."""
+
+        low = min(first, second)
+        high = max(first, second)
+        first_bit = 1 << first
+        second_bit = 1 << second
+        for i in prange(1 << (num_qubits - 2)):
+            base = ((i >> low) << (low + 1)) | (i & ((1 << low) - 1))
+            base = ((base >> high) << (high + 1)) | (base & ((1 << high) - 1))
+            i00 = base
+            i01 = base | second_bit
+            i10 = base | first_bit
+            i11 = i01 | first_bit
+            for part in range(2):
+                a0 = pairs[i00, part]
+                a1 = pairs[i01, part]
+                a2 = pairs[i10, part]
+                a3 = pairs[i11, part]
+                out[i00, part] = (
+                    matrix[0, 0] * a0 + matrix[0, 1] * a1 + matrix[0, 2] * a2 + matrix[0, 3] * a3
+                )
+                out[i01, part] = (
+                    matrix[1, 0] * a0 + matrix[1, 1] * a1 + matrix[1, 2] * a2 + matrix[1, 3] * a3
+                )
+                out[i10, part] = (
+                    matrix[2, 0] * a0 + matrix[2, 1] * a1 + matrix[2, 2] * a2 + matrix[2, 3] * a3
+                )
+                out[i11, part] = (
+                    matrix[3, 0] * a0 + matrix[3, 1] * a1 + matrix[3, 2] * a2 + matrix[3, 3] * a3
+                )
+        return out
+
+
+def apply_small_gate(
+    state: np.ndarray,
+    matrix: np.ndarray,
+    targets: Sequence[int],
+    num_qubits: int,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Dispatch a one- or two-qubit gate to the matching compiled kernel.
+
+    Real (float64) matrices run on the interleaved ``(re, im)`` view of the state. The state
+    keeps its own precision (``complex128`` or ``complex64``). The result is written to ``out``
+    when given, which must be a contiguous array of the state's shape and dtype.
+    """
+
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba is not installed; compiled gate kernels are unavailable.")
+    if len(targets) not in (1, 2):
+        raise ValueError(f"Compiled kernels support one or two targets, received {len(targets)}.")
+    vector = np.ascontiguousarray(state)
+    if out is None:
+        out = np.empty_like(vector)
+    if matrix.dtype == np.float64:
+        pairs = vector.view(vector.real.dtype).reshape(-1, 2)
+        out_pairs = out.view(out.real.dtype).reshape(-1, 2)
+        if len(targets) == 1:
+            m00, m01, m10, m11 = matrix[0, 0], matrix[0, 1], matrix[1, 0], matrix[1, 1]
+            apply_1q_real(pairs, out_pairs, m00, m01, m10, m11, targets[0], num_qubits)
+        else:
+            apply_2q_real(pairs, out_pairs, matrix, targets[0], targets[1], num_qubits)
+        return out
+    if len(targets) == 1:
+        m00, m01, m10, m11 = matrix[0, 0], matrix[0, 1], matrix[1, 0], matrix[1, 1]
+        apply_1q(vector, out, m00, m01, m10, m11, targets[0], num_qubits)
+    else:
+        apply_2q(vector, out, matrix, targets[0], targets[1], num_qubits)
+    return out
@@ -0,0 +1,180 @@
+"""Runtime-specialised gate kernels generated per gate placement.
+
+The solver applies the same few ``(gate, targets, num_qubits)`` combinations over and over, so
+each combination gets a straight-line kernel on first use: target bit positions become literal
+reshape dimensions, matrix entries become literal coefficients, zero entries are dropped and
+unit entries turn into plain copies or negations. Every kernel takes an optional ``out`` array of
+the state's shape and dtype and writes the result there instead of allocating.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from .gates_numba import NUMBA_AVAILABLE, apply_small_gate
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .gates import Gate
+
+
+Kernel = Callable[..., np.ndarray]
+
+_kernel_cache: Dict[Tuple["Gate", Tuple[int, ...], int], Kernel] = {}
+
+
+def _split_shape(targets: Tuple[int, ...], num_qubits: int) -> List[int]:
+    """Reshape dimensions that give every target qubit its own axis of length two."""
+
+    shape: List[int] = []
+    upper = num_qubits
+    for qubit in sorted(targets, reverse=True):
+        shape.extend((1 << (upper - 1 - qubit), 2))
+        upper = qubit
+    shape.append(1 << upper)
+    # A leading -1 lets the kernel run over a batch of states stacked along axis 0.
+    shape[0] = -1
+    return shape
+
+
+def _block_index(pattern: int, targets: Tuple[int, ...]) -> str:
+    """Index expression selecting the amplitudes whose target bits spell ``pattern``."""
+
+    arity = len(targets)
+    bits = {
+        qubit: (pattern >> (arity - 1 - position)) & 1 for position, qubit in enumerate(targets)
+    }
+    parts = [":"]
+    for qubit in sorted(targets, reverse=True):
+        parts.extend((str(bits[qubit]), ":"))
+    return ", ".join(parts)
+
+
+def _literal(coefficient: complex, *, real: bool) -> str:
+    return repr(float(coefficient.real)) if real else repr(complex(coefficient))
+
+
+def _row_expression(row: np.ndarray, *, real: bool) -> str:
+    nonzero = [(column, coefficient) for column, coefficient in enumerate(row) if coefficient != 0]
+    if not nonzero:
+        return "0.0"
+    # Rows such as H's ``[h, -h]`` share one magnitude: factor it out to a single multiply.
+    factor = nonzero[0][1]
+    if all(coefficient in (factor, -factor) for _, coefficient in nonzero):
+        signed = [
+            ("-" if coefficient == -factor else "+", f"a{column}")
+            for column, coefficient in nonzero
+        ]
+        body = " ".join(f"{sign} {name}" for sign, name in signed).lstrip("+ ")
+        if factor == 1:
+            return body
+        if factor == -1:
+            return f"-({body})" if len(signed) > 1 else f"-{body}"
+        return f"{_literal(factor, real=real)} * ({body})"
+    return " + ".join(
+        f"{_literal(coefficient, real=real)} * a{column}" for column, coefficient in nonzero
+    )
+
+
+def _kernel_source(gate: "Gate", targets: Tuple[int, ...], num_qubits: int) -> str:
+    real = gate._is_real
+    shape = _split_shape(targets, num_qubits)
+    if real:
+        shape.append(2)
+    lines = ["def kernel(state, out=None):"]
+    if real:
+        lines.append(f"    psi = state.view(state.real.dtype).reshape({tuple(shape)!r})")
+    else:
+        lines.append(f"    psi = state.reshape({tuple(shape)!r})")
+    lines.append("    if out is None:")
+    lines.append("        result = np.empty_like(psi)")
+    lines.append("    else:")
+    if real:
+        lines.append(f"        result = out.view(out.real.dtype).reshape({tuple(shape)!r})")
+    else:
+        lines.append(f"        result = out.reshape({tuple(shape)!r})")
+    block_size = 1 << len(targets)
+    for pattern in range(block_size):
+        lines.append(f"    a{pattern} = psi[{_block_index(pattern, targets)}]")
+    for pattern in range(block_size):
+        expression = _row_expression(gate.matrix[pattern], real=real)
+        lines.append(f"    result[{_block_index(pattern, targets)}] = {expression}")
+    lines.append("    if out is not None:")
+    lines.append("        return out")
+    if real:
+        lines.append("    return result.view(state.dtype).reshape(state.shape)")
+    else:
+        lines.append("    return result.reshape(state.shape)")
+    return "\n".join(lines) + "\n"
+
+
+def _permutation_source(
+    permutation: Tuple[int, ...], targets: Tuple[int, ...], num_qubits: int
+) -> np.ndarray:
+    """Source index of every amplitude under a permutation gate placed on ``targets``."""
+
+    arity = len(targets)
+    indices = np.arange(1 << num_qubits, dtype=np.intp)
+    pattern = np.zeros_like(indices)
+    cleared = indices.copy()
+    for position, qubit in enumerate(targets):
+        pattern |= ((indices >> qubit) & 1) << (arity - 1 - position)
+        cleared &= ~(1 << qubit)
+    source_pattern = np.asarray(permutation, dtype=np.intp)[pattern]
+    source = cleared
+    for position, qubit in enumerate(targets):
+        source |= ((source_pattern >> (arity - 1 - position)) & 1) << qubit
+    source.setflags(write=False)
+    return source
+
+
+def make_apply(gate: "Gate", targets: Tuple[int, ...], num_qubits: int) -> Kernel:
+    """Generate a kernel applying ``gate`` to ``targets`` of an n-qubit state.
+
+    Permutation gates become a precomputed gather. For other gates the generated body is
+    whole-array NumPy slicing, so it is left uncompiled: running it through ``numba.njit`` costs
+    far more per placement than the few array operations it would save. With Numba installed,
+    single state vectors under one- and two-qubit gates run the parallel kernels of
+    :mod:`.gates_numba` instead, which stream the amplitude pairs in one pass.
+    """
+
+    if gate._permutation is not None:
+        # X, CNOT and I only reorder amplitudes: a single gather replaces all arithmetic.
+        permutation = _permutation_source(gate._permutation, targets, num_qubits)
+
+        def kernel(state: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+            if out is None:
+                return state[..., permutation]
+            return np.take(state, permutation, axis=-1, out=out)
+
+        return kernel
+
+    source = _kernel_source(gate, targets, num_qubits)
+    namespace: Dict[str, object] = {"np": np}
+    exec(compile(source, f"<kernel {gate.name} {targets} n={num_qubits}>", "exec"), namespace)
+    generated: Kernel = namespace["kernel"]  # type: ignore[assignment]
+    if not NUMBA_AVAILABLE or len(targets) > 2:
+        return generated
+
+    # A float64 matrix selects the compiled kernels that run on the state's real view.
+    matrix = np.ascontiguousarray(gate.matrix.real if gate._is_real else gate.matrix)
+
+    def compiled(state: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        # Batches keep the generated slicing kernel, which handles the leading axis directly.
+        if state.ndim != 1:
+            return generated(state, out)
+        return apply_small_gate(state, matrix, targets, num_qubits, out)
+
+    return compiled
+
+
+def specialised_kernel(gate: "Gate", targets: Tuple[int, ...], num_qubits: int) -> Kernel:
+    """Return the cached kernel for a placement, generating it on first use."""
+
+    key = (gate, targets, num_qubits)
+    kernel = _kernel_cache.get(key)
+    if kernel is None:
+        kernel = make_apply(gate, targets, num_qubits)
+        _kernel_cache[key] = kernel
+    return kernel
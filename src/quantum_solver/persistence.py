@@ -6,16 +6,34 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+import numpy as np
+
 from .gates import GateOperation
 from .solver import SolverResult
 
-
-def _complex_to_pair(value: complex) -> List[float]:
-    return [float(value.real), float(value.imag)]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    orjson = None
 
 
 def amplitudes_to_pairs(amplitudes: Iterable[complex]) -> List[List[float]]:
-    return [_complex_to_pair(value) for value in amplitudes]
+    if not isinstance(amplitudes, np.ndarray):
+        amplitudes = list(amplitudes)
+    array = np.asarray(amplitudes, dtype=np.complex128)
+    return np.stack([array.real, array.imag], axis=1).tolist()
+
+
+def amplitudes_to_flat(amplitudes: Iterable[complex]) -> np.ndarray:
+    """Interleaved ``[re0, im0, re1, im1, ...]`` float64 buffer for the given amplitudes.
+
+    Contiguous ``complex128`` input is returned as a zero-copy view, which both serialisers
+    write out as a single flat array.
+    """
+
+    if not isinstance(amplitudes, np.ndarray):
+        amplitudes = list(amplitudes)
+    return np.ascontiguousarray(amplitudes, dtype=np.complex128).view(np.float64)
 
 
 def serialize_sequence(sequence: Iterable[GateOperation]) -> List[Dict[str, Any]]:
@@ -30,41 +48,83 @@ def serialize_sequence(sequence: Iterable[GateOperation]) -> List[Dict[str, Any]
     return serialized
 
 
-def _state_payload(state) -> Dict[str, Any]:
-    return {
-        "num_qubits": state.num_qubits,
-        "amplitudes": amplitudes_to_pairs(state.amplitudes),
-        "probabilities": list(state.as_probability_distribution()),
-    }
+def _state_payload(
+    state, cache: Dict[int, Dict[str, Any]], *, legacy: bool = True
+) -> Dict[str, Any]:
+    # The final state is usually the last step's state; serialise each object only once.
+    payload = cache.get(id(state))
+    if payload is None:
+        payload = {"num_qubits": state.num_qubits}
+        if legacy:
+            payload["amplitudes"] = amplitudes_to_pairs(state.amplitudes)
+        payload["flat_amplitudes"] = amplitudes_to_flat(state.amplitudes)
+        payload["probabilities"] = state.probabilities.tolist()
+        cache[id(state)] = payload
+    return payload
 
 
-def result_to_payload(result: SolverResult) -> Dict[str, Any]:
-    steps = []
-    for index, (operation, state) in enumerate(zip(result.sequence, result.states), start=1):
-        steps.append(
-            {
-                "layer": index,
-                "operation": {
-                    "gate": operation.gate.name,
-                    "targets": list(operation.targets),
-                },
-                "state": _state_payload(state),
-            }
-        )
+def result_to_payload(
+    result: SolverResult, *, include_steps: bool = True, legacy: bool = True
+) -> Dict[str, Any]:
+    """Build the JSON-ready result payload.
+
+    ``include_steps=False`` omits the per-layer ``steps`` trace, which serialises a full state for
+    every layer and dominates the payload size for deep sequences or many qubits.
 
-    return {
+    Every state carries ``flat_amplitudes``, the interleaved real/imaginary parts as one flat
+    array. ``legacy=False`` drops the older ``amplitudes`` list of ``[re, im]`` pairs.
+    """
+
+    state_payloads: Dict[int, Dict[str, Any]] = {}
+    payload: Dict[str, Any] = {
         "success": result.success,
         "distance": result.distance,
         "layers_used": result.layers_used,
         "sequence": serialize_sequence(result.sequence),
-        "steps": steps,
-        "final_state": _state_payload(result.final_state),
     }
-
-
-def write_result(result: SolverResult, destination: str | Path) -> Path:
+    if include_steps:
+        steps = []
+        for index, (operation, state) in enumerate(zip(result.sequence, result.states), start=1):
+            steps.append(
+                {
+                    "layer": index,
+                    "operation": {
+                        "gate": operation.gate.name,
+                        "targets": list(operation.targets),
+                    },
+                    "state": _state_payload(state, state_payloads, legacy=legacy),
+                }
+            )
+        payload["steps"] = steps
+    payload["final_state"] = _state_payload(result.final_state, state_payloads, legacy=legacy)
+    return payload
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialise a payload as indented JSON, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, indent=2, default=_json_default).encode("utf-8")
+
+
+def write_result(
+    result: SolverResult,
+    destination: str | Path,
+    *,
+    include_steps: bool = True,
+    legacy: bool = True,
+) -> Path:
     path = Path(destination)
     path.parent.mkdir(parents=True, exist_ok=True)
-    payload = result_to_payload(result)
-    path.write_text(json.dumps(payload, indent=2))
+    payload = result_to_payload(result, include_steps=include_steps, legacy=legacy)
+    path.write_bytes(dumps_payload(payload))
     return path
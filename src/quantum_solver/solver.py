@@ -2,15 +2,251 @@
 
 from __future__ import annotations
 
-from collections import deque
+import hashlib
+import math
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from .gates import SUPPORTED_GATES, Gate, GateOperation
-from .state import QuantumState
+from .state import QuantumState, StateBuffer
+from .state_numba import NUMBA_AVAILABLE, quantise_parts
+
+
+# 64-bit digest of the quantised amplitudes; fixed size regardless of qubit count.
+AmplitudeKey = int
+
+# Up to this state dimension a layer is expanded with one matrix product against the stacked
+# dense unitaries of its operations; beyond it the per-operation kernels are cheaper.
+_DENSE_EXPANSION_MAX_DIMENSION = 64
+
+# Finest state-key quantisation that float32 amplitudes resolve reliably.
+_COMPLEX64_MAX_DECIMALS = 6
+
+# Rounding slack on complex64 search distances: a few float32 epsilons of a unit vector, well
+# above the ~2 eps measured after dozens of gates. Candidates within ``tolerance`` plus this
+# slack are confirmed in complex128, so tolerances below float32 resolution still succeed.
+_COMPLEX64_DISTANCE_SLACK = 16 * float(np.finfo(np.float32).eps)
+
+# Slack on the pruning bound, covering the rounding of search-precision distances.
+_BOUND_MARGIN = 1e-4
+
+# Overlap-based distances below this are recomputed exactly (see _fidelity_distance).
+_EXACT_DISTANCE_BELOW = 1e-2
+
+
+def _commute(first: GateOperation, second: GateOperation) -> bool:
+    """Whether two placements commute: disjoint targets, or both gates diagonal."""
+
+    if not set(first.targets) & set(second.targets):
+        return True
+    return _is_diagonal(first.gate.matrix) and _is_diagonal(second.gate.matrix)
+
+
+def _is_diagonal(matrix: np.ndarray) -> bool:
+    return not np.count_nonzero(matrix - np.diag(np.diagonal(matrix)))
+
+
+@lru_cache(maxsize=None)
+def _displacement(gate: Gate) -> float:
+    """Spectral norm of ``gate - I``, the furthest the gate can move any unit vector."""
+
+    identity = np.eye(gate.matrix.shape[0])
+    return float(np.linalg.norm(gate.matrix - identity, 2))
+
+
+def _fidelity_distance(
+    vectors: np.ndarray, target_vector: np.ndarray, norms_squared: float = 2.0
+) -> np.ndarray:
+    """Euclidean distance of each row of ``vectors`` to ``target_vector``, via their overlap.
+
+    ``|a - b|**2 == |a|**2 + |b|**2 - 2 Re<b|a>``, so one matrix-vector product replaces the
+    difference array. ``norms_squared`` is ``|a|**2 + |b|**2``: gates are unitary, so every
+    search vector keeps the start state's norm, and it is 2 for normalised states. The identity
+    cancels badly near zero distance, where rows are recomputed from the difference so
+    tolerance checks keep full precision.
+    """
+
+    overlaps = (vectors @ target_vector.conj()).real
+    distances = np.sqrt(np.maximum(norms_squared - 2.0 * overlaps, 0.0))
+    close = np.flatnonzero(distances < _EXACT_DISTANCE_BELOW)
+    if close.size:
+        distances[close] = np.linalg.norm(vectors[close] - target_vector, axis=1)
+    return distances
+
+
+class _Frontier:
+    """FIFO of search nodes backed by a preallocated ring buffer of state vectors.
+
+    Vectors are copied into rows of one ``(capacity, 2**n)`` matrix, with node ids and depths in
+    parallel arrays; capacity doubles when the ring fills. :meth:`pop_batch` returns a view of
+    the popped rows where they are contiguous, so those rows are only released for reuse on the
+    following pop.
+    """
+
+    def __init__(self, dimension: int, dtype: np.dtype, capacity: int = 256) -> None:
+        self._states = np.empty((capacity, dimension), dtype=dtype)
+        self._nodes = np.empty(capacity, dtype=np.int64)
+        self._depths = np.empty(capacity, dtype=np.int64)
+        self._head = 0
+        self._size = 0
+        self._held = 0
+
+    def __len__(self) -> int:
+        return self._size - self._held
+
+    def push(self, vector: np.ndarray, node_id: int, depth: int) -> None:
+        capacity = len(self._nodes)
+        if self._size == capacity:
+            self._grow()
+            capacity = len(self._nodes)
+        slot = (self._head + self._size) % capacity
+        self._states[slot] = vector
+        self._nodes[slot] = node_id
+        self._depths[slot] = depth
+        self._size += 1
+
+    def pop_batch(self, limit: int) -> Tuple[np.ndarray, List[int], int]:
+        """Pop up to ``limit`` oldest entries that share the depth of the head entry."""
+
+        capacity = len(self._nodes)
+        if self._held:
+            self._head = (self._head + self._held) % capacity
+            self._size -= self._held
+            self._held = 0
+        if not self._size:
+            raise IndexError("pop from an empty frontier")
+        count = min(limit, self._size)
+        slots = (self._head + np.arange(count)) % capacity
+        depths = self._depths[slots]
+        depth = int(depths[0])
+        # Entries are pushed in breadth-first order, so depths never decrease along the ring.
+        count = int(np.searchsorted(depths, depth, side="right"))
+        slots = slots[:count]
+        if self._head + count <= capacity:
+            vectors = self._states[self._head : self._head + count]
+        else:
+            vectors = self._states[slots]
+        self._held = count
+        return vectors, self._nodes[slots].tolist(), depth
+
+    def _grow(self) -> None:
+        capacity = len(self._nodes)
+        # Unroll the ring so the oldest entry (possibly a held row) lands at index zero. The old
+        # matrix stays alive through any view already handed out by pop_batch().
+        order = (self._head + np.arange(capacity)) % capacity
+        states = np.empty((capacity * 2, self._states.shape[1]), dtype=self._states.dtype)
+        states[:capacity] = self._states[order]
+        nodes = np.empty(capacity * 2, dtype=np.int64)
+        nodes[:capacity] = self._nodes[order]
+        depths = np.empty(capacity * 2, dtype=np.int64)
+        depths[:capacity] = self._depths[order]
+        self._states, self._nodes, self._depths = states, nodes, depths
+        self._head = 0
+
+
+class _VisitedSet:
+    """Open-addressed hash set of 64-bit state keys held in flat NumPy arrays.
+
+    Keys are digests, so their low bits index the table directly and collisions are resolved
+    by linear probing. A whole batch of keys is probed together, one vectorised step per probe
+    distance, and every visited state costs eight bytes plus an occupancy flag. The table
+    doubles before it passes half full, which keeps probe runs short.
+    """
+
+    _MAX_LOAD = 0.5
 
+    def __init__(self, capacity: int = 1024) -> None:
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+        self._occupied = np.zeros(capacity, dtype=bool)
+        self._size = 0
 
-AmplitudeKey = Tuple[int, ...]
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, keys: np.ndarray) -> np.ndarray:
+        """Add ``keys``; returns a mask of those that were not in the set before the call.
+
+        A key repeated within ``keys`` is reported as new only at its first position.
+        """
+
+        while self._size + len(keys) > self._MAX_LOAD * len(self._keys):
+            self._grow()
+        mask = np.uint64(len(self._keys) - 1)
+        inserted = np.zeros(len(keys), dtype=bool)
+        pending = np.arange(len(keys))
+        slots = keys & mask
+        while pending.size:
+            occupied = self._occupied[slots]
+            found = occupied & (self._keys[slots] == keys[pending])
+            # Keys aiming at the same free slot: the earliest claims it and the rest probe again.
+            claims = np.flatnonzero(~occupied)
+            _, first = np.unique(slots[claims], return_index=True)
+            winners = claims[first]
+            self._keys[slots[winners]] = keys[pending[winners]]
+            self._occupied[slots[winners]] = True
+            inserted[pending[winners]] = True
+            self._size += len(winners)
+            settled = found
+            settled[winners] = True
+            advance = occupied & ~found
+            slots = np.where(advance, (slots + np.uint64(1)) & mask, slots)[~settled]
+            pending = pending[~settled]
+        return inserted
+
+    def _grow(self) -> None:
+        keys = self._keys[self._occupied]
+        capacity = len(self._keys) * 2
+        self._keys = np.zeros(capacity, dtype=np.uint64)
+        self._occupied = np.zeros(capacity, dtype=bool)
+        self._size = 0
+        self.insert(keys)
+
+
+class _SearchTrie:
+    """Parent-pointer trie of search nodes; node 0 is the root.
+
+    Each node stores its parent id and the operation that reached it as a small code into a
+    shared operation table, so a node costs ten bytes in two flat arrays instead of a tuple
+    holding object references. Sequences are only rebuilt as operations when needed.
+    """
+
+    def __init__(self) -> None:
+        self._parents = array("q", [-1])
+        self._codes = array("H", [0])
+        self._operations: List[GateOperation] = []
+        self._operation_codes: Dict[GateOperation, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+    def add(self, parent_id: int, operation: GateOperation) -> int:
+        code = self._operation_codes.get(operation)
+        if code is None:
+            code = len(self._operations)
+            self._operations.append(operation)
+            self._operation_codes[operation] = code
+        self._parents.append(parent_id)
+        self._codes.append(code)
+        return len(self._parents) - 1
+
+    def operation(self, node_id: int) -> Optional[GateOperation]:
+        """Operation applied to reach ``node_id``; ``None`` for the root."""
+
+        return self._operations[self._codes[node_id]] if node_id > 0 else None
+
+    def sequence_to(self, node_id: int) -> List[GateOperation]:
+        """Rebuild the operation sequence leading to ``node_id`` by walking parent pointers."""
+
+        sequence: List[GateOperation] = []
+        while node_id > 0:
+            sequence.append(self._operations[self._codes[node_id]])
+            node_id = self._parents[node_id]
+        sequence.reverse()
+        return sequence
 
 
 @dataclass
@@ -39,13 +275,42 @@ class GateSequenceSolver:
         fixed_operations: Optional[Dict[int, GateOperation]] = None,
         layer_gate_allowlists: Optional[Dict[int, Sequence[str]]] = None,
         default_layer_gate_allowlist: Optional[Sequence[str]] = None,
+        search_dtype: np.dtype | type = np.complex64,
+        batch_size: int = 256,
     ) -> None:
         if num_qubits <= 0:
             raise ValueError("Solver must operate on at least one qubit.")
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+        if np.dtype(search_dtype) not in (np.dtype(np.complex64), np.dtype(np.complex128)):
+            raise ValueError("Search precision must be complex64 or complex128.")
         self.num_qubits = num_qubits
         self.tolerance = tolerance
+        # Candidates are explored at this precision; reported results are always re-simulated
+        # in complex128.
+        self.search_dtype = np.dtype(search_dtype)
         self.quantisation_decimals = quantisation_decimals
-        self._quantisation_scale = 10**quantisation_decimals
+        key_decimals = quantisation_decimals
+        if self.search_dtype == np.complex64:
+            # float32 resolves only ~7 significant digits; finer keys split equal states whose
+            # last bits differ by rounding, and the search then re-expands them as new states.
+            key_decimals = min(key_decimals, _COMPLEX64_MAX_DECIMALS)
+        self._quantisation_scale = 10**key_decimals
+        self._distance_slack = (
+            _COMPLEX64_DISTANCE_SLACK if self.search_dtype == np.complex64 else 0.0
+        )
+        # Random odd multipliers for the in-batch fingerprints used by _state_keys.
+        weights = np.random.default_rng(0).integers(1, 2**63, size=2 << num_qubits, dtype=np.uint64)
+        self._fingerprint_weights = weights | np.uint64(1)
+        self.batch_size = batch_size
+        # Transposed full unitaries per operation, and their stacks per layer operation tuple,
+        # for the dense expansion path.
+        self._dense_unitaries: Dict[GateOperation, np.ndarray] = {}
+        self._dense_expansions: Dict[Tuple[GateOperation, ...], np.ndarray] = {}
+        # Commutation pruning tables per layer operation set, keyed by the set's identity.
+        self._prune_tables: Dict[
+            int, Tuple[Sequence[GateOperation], Dict[GateOperation, int], np.ndarray]
+        ] = {}
 
         gate_symbols = allowed_gates if allowed_gates is not None else SUPPORTED_GATES.keys()
         gates: List[Gate] = []
@@ -74,7 +339,8 @@ class GateSequenceSolver:
                         f"Fixed operation '{operation.describe()}' targets invalid qubit {target} "
                         f"for {self.num_qubits}-qubit solver."
                     )
-        self._fixed_layers = sorted(self.fixed_operations.keys())
+        # Every fixed layer has been applied once a sequence is longer than the last of them.
+        self._max_fixed_layer = max(self.fixed_operations) if self.fixed_operations else -1
         gate_names = {gate.name for gate in self.gates}
         self._layer_specific_operations: Dict[int, Tuple[GateOperation, ...]] = {}
         if layer_gate_allowlists is not None:
@@ -145,15 +411,114 @@ class GateSequenceSolver:
                 raise NotImplementedError(
                     f"Gate {gate.name} with arity {gate.num_qubits} is not supported in solver."
                 )
+        if 2**self.num_qubits <= _DENSE_EXPANSION_MAX_DIMENSION:
+            for operation in operations:
+                self._dense_unitary(operation)
         return operations
 
-    def _state_key(self, amplitudes: Tuple[complex, ...]) -> AmplitudeKey:
-        scale = self._quantisation_scale
-        key_parts: List[int] = []
-        for amplitude in amplitudes:
-            key_parts.append(int(round(amplitude.real * scale)))
-            key_parts.append(int(round(amplitude.imag * scale)))
-        return tuple(key_parts)
+    def _dense_unitary(self, operation: GateOperation) -> np.ndarray:
+        """Transposed full unitary of ``operation`` at the search precision, built once."""
+
+        transposed = self._dense_unitaries.get(operation)
+        if transposed is None:
+            transposed = operation.unitary(self.num_qubits).T.astype(self.search_dtype)
+            self._dense_unitaries[operation] = transposed
+        return transposed
+
+    def _state_key(self, amplitudes: np.ndarray | bytes | Sequence[complex]) -> AmplitudeKey:
+        # Quantise the interleaved (re, im) view in one vectorised pass, then digest the integers
+        # so every visited entry costs the same 8 bytes however many qubits are simulated.
+        if isinstance(amplitudes, bytes):
+            vector = np.frombuffer(amplitudes, dtype=self.search_dtype)
+        else:
+            vector = np.asarray(amplitudes)
+            if not np.iscomplexobj(vector):
+                vector = vector.astype(np.complex128)
+            vector = np.ascontiguousarray(vector)
+        parts = vector.view(vector.real.dtype)
+        if NUMBA_AVAILABLE:
+            quantised = quantise_parts(parts, self._quantisation_scale)
+        else:
+            quantised = np.rint(parts * self._quantisation_scale).astype(np.int64)
+        digest = hashlib.blake2b(quantised.tobytes(), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+    def _state_keys(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """First row index and key of every distinct state in a ``(batch, 2**n)`` array.
+
+        Many operations commute or cancel, so a batch usually repeats most of its states. Rows
+        are quantised in one pass and grouped with ``np.unique`` on a vectorised 64-bit
+        multilinear fingerprint; only the first row of each group is digested. Returns the
+        rows in ascending order and their keys as a ``uint64`` array.
+        """
+
+        parts = np.ascontiguousarray(vectors).view(vectors.real.dtype)
+        if NUMBA_AVAILABLE:
+            quantised = quantise_parts(parts.reshape(-1), self._quantisation_scale)
+            quantised = quantised.reshape(parts.shape)
+        else:
+            quantised = np.rint(parts * self._quantisation_scale).astype(np.int64)
+        fingerprints = (quantised.view(np.uint64) * self._fingerprint_weights).sum(axis=1)
+        first_rows = np.sort(np.unique(fingerprints, return_index=True)[1])
+        digests = b"".join(
+            hashlib.blake2b(row.tobytes(), digest_size=8).digest() for row in quantised[first_rows]
+        )
+        return first_rows, np.frombuffer(digests, dtype="<u8")
+
+    def _expand(self, vectors: np.ndarray, operations: Sequence[GateOperation]) -> np.ndarray:
+        """Apply every operation to every row of ``vectors``; returns ``(batch, ops, 2**n)``."""
+
+        batch, dimension = vectors.shape
+        if dimension <= _DENSE_EXPANSION_MAX_DIMENSION:
+            key = tuple(operations)
+            stacked = self._dense_expansions.get(key)
+            if stacked is None:
+                stacked = np.concatenate([self._dense_unitary(op) for op in operations], axis=1)
+                self._dense_expansions[key] = stacked
+            return (vectors @ stacked).reshape(batch, len(operations), dimension)
+        children = np.empty((batch, len(operations), dimension), dtype=vectors.dtype)
+        for index, operation in enumerate(operations):
+            children[:, index] = operation.apply_batch(vectors, self.num_qubits)
+        return children
+
+    def _prune_table(
+        self, operations: Sequence[GateOperation]
+    ) -> Tuple[Dict[GateOperation, int], np.ndarray]:
+        """Positions of ``operations`` and the table of non-canonical commuting pairs.
+
+        ``table[p, c]`` is true when ``operations[c]`` directly after ``operations[p]`` commutes
+        with it and has the lower position, so the same state is reached with the pair in the
+        opposite order. The extra last row, for parents outside the set, is all false.
+        """
+
+        entry = self._prune_tables.get(id(operations))
+        if entry is None or entry[0] is not operations:
+            count = len(operations)
+            table = np.zeros((count + 1, count), dtype=bool)
+            for parent in range(count):
+                for child in range(parent):
+                    table[parent, child] = _commute(operations[parent], operations[child])
+            positions = {operation: index for index, operation in enumerate(operations)}
+            entry = (operations, positions, table)
+            self._prune_tables[id(operations)] = entry
+        return entry[1], entry[2]
+
+    @staticmethod
+    def _remaining_reach(layer_operations: Sequence[Sequence[GateOperation]]) -> List[float]:
+        """``reach[d]``: the most layers ``d`` onwards can reduce a distance to the target.
+
+        Applying ``U`` moves a unit vector by at most ``||U - I||`` (spectral norm), so by the
+        triangle inequality the distance to the target shrinks by at most that much per layer.
+        """
+
+        reach = [0.0] * (len(layer_operations) + 1)
+        for depth in range(len(layer_operations) - 1, -1, -1):
+            step = max(
+                (_displacement(operation.gate) for operation in layer_operations[depth]),
+                default=0.0,
+            )
+            reach[depth] = reach[depth + 1] + step
+        return reach
 
     def _operations_for_depth(self, depth: int) -> Sequence[GateOperation]:
         fixed_operation = self.fixed_operations.get(depth)
@@ -200,14 +565,19 @@ class GateSequenceSolver:
             padded.append(identity_op)
         return padded
 
-    def _fixed_layers_satisfied(self, sequence_length: int) -> bool:
-        if not self._fixed_layers:
-            return True
-        last_applied_index = sequence_length - 1
-        for layer in self._fixed_layers:
-            if layer > last_applied_index:
-                return False
-        return True
+    def _reaches_target(
+        self,
+        buffer: StateBuffer,
+        start: QuantumState,
+        sequence: Sequence[GateOperation],
+        target: QuantumState,
+    ) -> bool:
+        """Replay ``sequence`` from ``start`` in ``buffer`` and check it ends within tolerance."""
+
+        buffer.load(start)
+        for operation in sequence:
+            buffer.apply(operation)
+        return buffer.distance(target) <= self.tolerance
 
     def _evolve_states(
         self, start: QuantumState, sequence: Sequence[GateOperation]
@@ -225,11 +595,33 @@ class GateSequenceSolver:
         target: QuantumState,
         *,
         max_layers: int,
+        bidirectional: bool = False,
     ) -> SolverResult:
+        """Search for the shortest gate sequence taking ``start`` to ``target``.
+
+        ``bidirectional=True`` grows a second search backwards from ``target`` with inverse gates
+        and joins the two where they reach the same state, which visits far fewer states for deep
+        searches. It needs the same gate choices on every layer, so it cannot be combined with
+        fixed gates or per-layer constraints. The halves meet where their states share a key or
+        lie within tolerance of each other, and a failed search reports the best state found from
+        the forward half.
+
+        The search runs in host memory: states on the CuPy backend are copied to the host first,
+        and the result's states are NumPy-backed.
+        """
+
         if start.num_qubits != self.num_qubits or target.num_qubits != self.num_qubits:
             raise ValueError("Solver and states disagree on qubit count.")
+        # Candidates are confirmed and reported in complex128 whatever precision the inputs use.
+        start = start.to_backend("numpy").astype(np.complex128)
+        target = target.to_backend("numpy").astype(np.complex128)
+        if bidirectional and (self.fixed_operations or self._layer_specific_operations):
+            raise ValueError(
+                "Bidirectional search cannot be combined with fixed gates or per-layer "
+                "gate constraints."
+            )
 
-        if self._fixed_layers and max(self._fixed_layers) >= max_layers:
+        if self._max_fixed_layer >= max_layers:
             raise ValueError(
                 "A fixed gate is defined beyond the configured maximum number of layers."
             )
@@ -239,7 +631,7 @@ class GateSequenceSolver:
             )
 
         initial_distance = start.distance(target)
-        if initial_distance <= self.tolerance and not self._fixed_layers:
+        if initial_distance <= self.tolerance and self._max_fixed_layer < 0:
             return SolverResult(
                 success=True,
                 sequence=[],
@@ -249,57 +641,308 @@ class GateSequenceSolver:
                 states=[],
             )
 
-        frontier = deque([(start.amplitudes, [])])
-        visited_layers: Dict[int, set[AmplitudeKey]] = {0: {self._state_key(start.amplitudes)}}
-        best_state = start.copy()
-        best_sequence: List[GateOperation] = []
+        # States built with normalise=False keep their own norm, which the overlap-based
+        # distances need; it is 2 for normalised states.
+        start_squared = float(np.vdot(start.amplitudes, start.amplitudes).real)
+        norms_squared = start_squared + float(np.vdot(target.amplitudes, target.amplitudes).real)
+
+        if bidirectional:
+            return self._solve_bidirectional(
+                start,
+                target,
+                max_layers=max_layers,
+                initial_distance=initial_distance,
+                norms_squared=norms_squared,
+            )
+
+        # The search works on raw ndarrays; QuantumState objects are only built for the result.
+        start_vector = start.astype(self.search_dtype).amplitudes
+        target_vector = target.astype(self.search_dtype).amplitudes
+        # Sequences are stored once as a parent-pointer trie and rebuilt only when needed.
+        nodes = _SearchTrie()
+        frontier = _Frontier(len(start_vector), self.search_dtype)
+        frontier.push(start_vector, 0, 0)
+        visited_layers: Dict[int, _VisitedSet] = {}
+        # The best child so far, as (parent node id, operation); its sequence is rebuilt once at
+        # the end rather than on every improvement.
+        best_child: Optional[Tuple[int, GateOperation]] = None
         best_distance = initial_distance
+        # Layer choices are resolved once per solve; the loop then only indexes this list.
+        layer_operations = [self._operations_for_depth(depth) for depth in range(max_layers)]
+        # The most a layer moves a state scales with its norm, which gates preserve.
+        start_norm = math.sqrt(start_squared)
+        reach = [step * start_norm for step in self._remaining_reach(layer_operations)]
+        confirm_buffer = StateBuffer(self.num_qubits, start.dtype)
+        screen_tolerance = self.tolerance + self._distance_slack
 
         while frontier:
-            state_vector, sequence = frontier.popleft()
-            depth = len(sequence)
+            # Nodes of one depth share an operation set, so they are expanded together.
+            vectors, node_ids, depth = frontier.pop_batch(self.batch_size)
             if depth >= max_layers:
                 continue
 
-            for operation in self._operations_for_depth(depth):
-                new_vector = operation.apply(state_vector, self.num_qubits)
-                new_state = QuantumState.from_amplitudes(new_vector, normalise=True)
-                new_distance = new_state.distance(target)
-                new_sequence = sequence + [operation]
-                if new_distance < best_distance - self.tolerance * 0.1:
-                    best_distance = new_distance
-                    best_state = new_state
-                    best_sequence = list(new_sequence)
+            next_depth = depth + 1
+            operations = layer_operations[depth]
+            children = self._expand(vectors, operations)
+            flat_children = children.reshape(-1, children.shape[2])
+            distances = _fidelity_distance(flat_children, target_vector, norms_squared)
+            operation_count = len(operations)
 
-                if new_distance <= self.tolerance and self._fixed_layers_satisfied(len(new_sequence)):
-                    final_sequence = self._pad_sequence_to_layers(new_sequence, max_layers=max_layers)
+            # Children are screened with vectorised comparisons so that only the few that can
+            # finish the search or improve the best distance are handled one by one. Each
+            # group is walked in child order, matching a child-by-child search.
+            if next_depth > self._max_fixed_layer:
+                for index in np.flatnonzero(distances <= screen_tolerance).tolist():
+                    node_id = node_ids[index // operation_count]
+                    new_sequence = nodes.sequence_to(node_id)
+                    new_sequence.append(operations[index % operation_count])
+                    final_sequence = self._pad_sequence_to_layers(
+                        new_sequence, max_layers=max_layers
+                    )
+                    # The screen allows for search-precision rounding, so confirm the candidate
+                    # in complex128 before building the per-layer states of the result. One that
+                    # falls short stays an ordinary child and is expanded like the rest.
+                    if not self._reaches_target(confirm_buffer, start, final_sequence, target):
+                        continue
                     states = self._evolve_states(start, final_sequence)
                     final_state = states[-1] if states else start.copy()
                     final_distance = final_state.distance(target)
                     return SolverResult(
                         success=True,
                         sequence=final_sequence,
-                        layers_used=len(new_sequence),
+                        layers_used=next_depth,
                         final_state=final_state,
                         distance=final_distance,
                         states=states,
                     )
 
-                key = self._state_key(new_state.amplitudes)
-                next_depth = len(new_sequence)
-                layer_bucket = visited_layers.setdefault(next_depth, set())
-                if key not in layer_bucket:
-                    layer_bucket.add(key)
-                    frontier.append((new_state.amplitudes, new_sequence))
+            # The best distance only decreases, so children above the current threshold can
+            # never pass the sequential check below.
+            improving = np.flatnonzero(distances < best_distance - self.tolerance * 0.1)
+            for index in improving.tolist():
+                new_distance = float(distances[index])
+                if new_distance < best_distance - self.tolerance * 0.1:
+                    best_distance = new_distance
+                    best_child = (
+                        node_ids[index // operation_count],
+                        operations[index % operation_count],
+                    )
+
+            # The last layer's children have no layers left to expand, so none is enqueued.
+            if next_depth == max_layers:
+                continue
+            # A child whose distance minus the most the remaining layers can move a state can
+            # neither reach the tolerance nor beat the best distance: its subtree is skipped.
+            threshold = max(self.tolerance, best_distance - self.tolerance * 0.1)
+            keep = distances - reach[next_depth] <= threshold + _BOUND_MARGIN
+            # When this layer offers the same operations as the previous one, a commuting pair
+            # is only expanded in ascending order; the swapped order reaches the same state.
+            # Pruned children were still checked above, so no solution at this depth is lost.
+            if depth and layer_operations[depth - 1] is operations:
+                positions, table = self._prune_table(operations)
+                parents = [
+                    positions.get(nodes.operation(parent), operation_count) for parent in node_ids
+                ]
+                keep &= ~table[parents].ravel()
+            kept = np.flatnonzero(keep)
+            if not kept.size:
+                continue
+            first_rows, keys = self._state_keys(flat_children[kept])
+            # Repeats of a state earlier in the batch share its key and were dropped above.
+            rows = kept[first_rows]
+            layer_bucket = visited_layers.get(next_depth)
+            if layer_bucket is None:
+                layer_bucket = visited_layers[next_depth] = _VisitedSet()
+            for index in rows[layer_bucket.insert(keys)].tolist():
+                parent_id = node_ids[index // operation_count]
+                node_id = nodes.add(parent_id, operations[index % operation_count])
+                frontier.push(flat_children[index], node_id, next_depth)
 
+        best_sequence: List[GateOperation] = []
+        if best_child is not None:
+            best_sequence = nodes.sequence_to(best_child[0])
+            best_sequence.append(best_child[1])
         states = self._evolve_states(start, best_sequence)
-        final_state = states[-1] if states else best_state
+        final_state = states[-1] if states else start.copy()
+
+        return SolverResult(
+            success=False,
+            sequence=best_sequence,
+            layers_used=len(best_sequence),
+            final_state=final_state,
+            distance=final_state.distance(target),
+            states=states,
+        )
+
+    def _expand_level(
+        self,
+        vectors: np.ndarray,
+        node_ids: List[int],
+        operations: Sequence[GateOperation],
+        labels: Sequence[GateOperation],
+        nodes: _SearchTrie,
+        seen: Dict[AmplitudeKey, int],
+    ) -> Tuple[np.ndarray, List[int], List[AmplitudeKey]]:
+        """Expand one breadth-first level, keeping states not reached before on this side.
+
+        Children produced by ``operations[i]`` are recorded in the trie as ``labels[i]``. Returns
+        the new level's vectors, node ids and state keys.
+        """
 
+        count = len(operations)
+        kept_vectors: List[np.ndarray] = []
+        kept_ids: List[int] = []
+        kept_keys: List[AmplitudeKey] = []
+        for begin in range(0, len(node_ids), self.batch_size):
+            batch_ids = node_ids[begin : begin + self.batch_size]
+            children = self._expand(vectors[begin : begin + self.batch_size], operations)
+            flat_children = children.reshape(-1, children.shape[2])
+            first_rows, keys = self._state_keys(flat_children)
+            kept_rows: List[int] = []
+            for index, key in zip(first_rows.tolist(), keys.tolist()):
+                if key in seen:
+                    continue
+                node_id = nodes.add(batch_ids[index // count], labels[index % count])
+                seen[key] = node_id
+                kept_rows.append(index)
+                kept_ids.append(node_id)
+                kept_keys.append(key)
+            kept_vectors.append(flat_children[kept_rows])
+        return np.concatenate(kept_vectors), kept_ids, kept_keys
+
+    def _close_pairs(
+        self, vectors: np.ndarray, others: np.ndarray, norms_squared: float
+    ) -> List[Tuple[int, int]]:
+        """Index pairs of rows of ``vectors`` and ``others`` within tolerance of each other.
+
+        Gates preserve distances, so a forward state this close to a backward state finishes
+        within tolerance of the target even when the two never share a state key, as happens for
+        targets off the gate set's grid. Overlaps screen the pairs batch by batch and the few
+        candidates are measured exactly, as in :func:`_fidelity_distance`.
+        """
+
+        pairs: List[Tuple[int, int]] = []
+        if not len(vectors) or not len(others):
+            return pairs
+        screen = 0.5 * (norms_squared - _EXACT_DISTANCE_BELOW**2)
+        conjugated = others.conj().T
+        for begin in range(0, len(vectors), self.batch_size):
+            block = vectors[begin : begin + self.batch_size]
+            rows, columns = np.nonzero((block @ conjugated).real > screen)
+            if not rows.size:
+                continue
+            distances = np.linalg.norm(block[rows] - others[columns], axis=1)
+            close = distances <= self.tolerance + self._distance_slack
+            pairs.extend(zip((rows[close] + begin).tolist(), columns[close].tolist()))
+        return pairs
+
+    def _solve_bidirectional(
+        self,
+        start: QuantumState,
+        target: QuantumState,
+        *,
+        max_layers: int,
+        initial_distance: float,
+        norms_squared: float,
+    ) -> SolverResult:
+        operations = tuple(self._operations_for_depth(0))
+        inverses = tuple(
+            GateOperation(gate=operation.gate.adjoint(), targets=operation.targets)
+            for operation in operations
+        )
+        start_vector = start.astype(self.search_dtype).amplitudes
+        target_vector = target.astype(self.search_dtype).amplitudes
+
+        # Both sides record the forward operation on each trie edge. The backward side applies
+        # its inverse, so a backward path read root-to-leaf is the tail of the sequence reversed.
+        forward_nodes = _SearchTrie()
+        backward_nodes = _SearchTrie()
+        forward_seen = {self._state_key(start_vector): 0}
+        backward_seen = {self._state_key(target_vector): 0}
+        forward_level = (start_vector[np.newaxis], [0])
+        backward_level = (target_vector[np.newaxis], [0])
+        forward_depth = backward_depth = 0
+        best_node_id = 0
+        best_distance = initial_distance
+        confirm_buffer = StateBuffer(self.num_qubits, start.dtype)
+
+        while forward_depth + backward_depth < max_layers:
+            forward_vectors, forward_ids = forward_level
+            backward_vectors, backward_ids = backward_level
+            if not forward_ids or not backward_ids:
+                break
+            meetings: List[List[GateOperation]] = []
+            # Grow the smaller side; ties go forward.
+            if len(forward_ids) <= len(backward_ids):
+                vectors, ids, keys = self._expand_level(
+                    forward_vectors,
+                    forward_ids,
+                    operations,
+                    operations,
+                    forward_nodes,
+                    forward_seen,
+                )
+                forward_level = (vectors, ids)
+                forward_depth += 1
+                if ids:
+                    distances = _fidelity_distance(vectors, target_vector, norms_squared)
+                    improving = np.flatnonzero(distances < best_distance - self.tolerance * 0.1)
+                    for index in improving.tolist():
+                        if distances[index] < best_distance - self.tolerance * 0.1:
+                            best_distance = float(distances[index])
+                            best_node_id = ids[index]
+                for node_id, key in zip(ids, keys):
+                    other = backward_seen.get(key)
+                    if other is not None:
+                        tail = backward_nodes.sequence_to(other)
+                        meetings.append(forward_nodes.sequence_to(node_id) + tail[::-1])
+                for row, column in self._close_pairs(vectors, backward_vectors, norms_squared):
+                    tail = backward_nodes.sequence_to(backward_ids[column])
+                    meetings.append(forward_nodes.sequence_to(ids[row]) + tail[::-1])
+            else:
+                vectors, ids, keys = self._expand_level(
+                    backward_vectors,
+                    backward_ids,
+                    inverses,
+                    operations,
+                    backward_nodes,
+                    backward_seen,
+                )
+                backward_level = (vectors, ids)
+                backward_depth += 1
+                for node_id, key in zip(ids, keys):
+                    other = forward_seen.get(key)
+                    if other is not None:
+                        tail = backward_nodes.sequence_to(node_id)
+                        meetings.append(forward_nodes.sequence_to(other) + tail[::-1])
+                for row, column in self._close_pairs(vectors, forward_vectors, norms_squared):
+                    tail = backward_nodes.sequence_to(ids[row])
+                    meetings.append(forward_nodes.sequence_to(forward_ids[column]) + tail[::-1])
+
+            # Meetings can join nodes of different depths; confirm the shortest first.
+            for sequence in sorted(meetings, key=len):
+                final_sequence = self._pad_sequence_to_layers(sequence, max_layers=max_layers)
+                if self._reaches_target(confirm_buffer, start, final_sequence, target):
+                    states = self._evolve_states(start, final_sequence)
+                    final_state = states[-1] if states else start.copy()
+                    final_distance = final_state.distance(target)
+                    return SolverResult(
+                        success=True,
+                        sequence=final_sequence,
+                        layers_used=len(sequence),
+                        final_state=final_state,
+                        distance=final_distance,
+                        states=states,
+                    )
+
+        best_sequence = forward_nodes.sequence_to(best_node_id)
+        states = self._evolve_states(start, best_sequence)
+        final_state = states[-1] if states else start.copy()
         return SolverResult(
             success=False,
             sequence=best_sequence,
             layers_used=len(best_sequence),
             final_state=final_state,
-            distance=best_distance,
+            distance=final_state.distance(target),
             states=states,
         )
@@ -3,39 +3,96 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from typing import Iterable, Sequence, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable, Literal, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .gates import GateOperation
+from .gates_cupy import array_module, is_device_array, to_device, to_host
+from .state_numba import NUMBA_AVAILABLE, squared_distance, squared_norm
+
+
+AmplitudeVector = np.ndarray
 
+# Where a state's amplitudes live: host memory (NumPy) or a CUDA device (CuPy).
+StateBackend = Literal["numpy", "cupy"]
 
-AmplitudeVector = Tuple[complex, ...]
 
+def _freeze(vector: np.ndarray) -> np.ndarray:
+    # CuPy arrays have no write flag; device states rely on every operation returning new arrays.
+    if isinstance(vector, np.ndarray):
+        vector.setflags(write=False)
+    return vector
 
+
+@lru_cache(maxsize=64)
 def _validate_dimension(length: int) -> int:
     if length == 0:
         raise ValueError("Quantum state must contain at least one amplitude.")
-    num_qubits = int(math.log2(length))
-    if 2**num_qubits != length:
+    # A power of two has a single set bit; integer checks stay exact at any length.
+    if length & (length - 1):
         raise ValueError(
             f"State vector length {length} is not a power of two and cannot represent qubits."
         )
-    return num_qubits
+    return length.bit_length() - 1
+
+
+def _squared_norm(amplitudes: AmplitudeVector) -> float:
+    if is_device_array(amplitudes):
+        return float(array_module(amplitudes).vdot(amplitudes, amplitudes).real)
+    if NUMBA_AVAILABLE:
+        return squared_norm(amplitudes)
+    # vdot conjugates its first argument, so this is the BLAS dot product <v|v>.
+    return float(np.vdot(amplitudes, amplitudes).real)
+
+
+def _is_unit_norm(amplitudes: AmplitudeVector, norm_squared: Optional[float] = None) -> bool:
+    if norm_squared is None:
+        norm_squared = _squared_norm(amplitudes)
+    # Rescaling in float32 only reaches unit norm to a few float32 epsilons (~1e-7), so the
+    # complex128 bound of 1e-9 would rescale complex64 vectors that are already as close as
+    # they can get.
+    rel_tol = 1e-6 if amplitudes.dtype == np.complex64 else 1e-9
+    return math.isclose(norm_squared, 1.0, rel_tol=rel_tol, abs_tol=1e-12)
+
 
+def _normalise(amplitudes: AmplitudeVector, *, in_place: bool = False) -> AmplitudeVector:
+    """Scale ``amplitudes`` to unit norm; ``in_place`` rescales a caller-owned buffer directly."""
 
-def _normalise(amplitudes: AmplitudeVector) -> AmplitudeVector:
-    norm_squared = sum(abs(value) ** 2 for value in amplitudes)
-    if math.isclose(norm_squared, 1.0, rel_tol=1e-9, abs_tol=1e-12):
+    norm_squared = _squared_norm(amplitudes)
+    if _is_unit_norm(amplitudes, norm_squared):
         return amplitudes
     if math.isclose(norm_squared, 0.0, abs_tol=1e-12):
         raise ValueError("Cannot normalise the zero vector.")
     scale = math.sqrt(norm_squared)
-    return tuple(value / scale for value in amplitudes)
+    if in_place:
+        amplitudes /= scale
+        return amplitudes
+    return amplitudes / scale
+
+
+def _distance(first: AmplitudeVector, second: AmplitudeVector) -> float:
+    if is_device_array(first) or is_device_array(second):
+        xp = array_module(first if is_device_array(first) else second)
+        return float(xp.linalg.norm(xp.asarray(first) - xp.asarray(second)))
+    if NUMBA_AVAILABLE:
+        return math.sqrt(squared_distance(first, second))
+    return float(np.linalg.norm(first - second))
 
 
 def amplitudes_from_components(components: Sequence[Sequence[float]]) -> AmplitudeVector:
     """Build a complex array from a sequence of (real, imag) pairs."""
 
+    try:
+        array = np.asarray(components)
+    except ValueError:  # ragged input; the loop below reports the offending pair
+        array = None
+    if array is not None and array.ndim == 2 and array.shape[1] == 2 and array.dtype.kind in "biuf":
+        # Consecutive (real, imag) float64 pairs are exactly the memory layout of complex128.
+        return np.ascontiguousarray(array, dtype=np.float64).view(np.complex128).reshape(-1)
+
     data = []
     for index, pair in enumerate(components):
         if len(pair) != 2:
@@ -44,46 +101,165 @@ def amplitudes_from_components(components: Sequence[Sequence[float]]) -> Amplitu
             )
         real, imag = pair
         data.append(complex(real, imag))
-    return tuple(data)
+    return np.array(data, dtype=np.complex128)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class QuantumState:
-    """Immutable wrapper for an n-qubit state vector."""
+    """Immutable wrapper for an n-qubit state vector.
+
+    Amplitudes are held in a read-only complex array so gate kernels can operate on the buffer
+    directly. States default to ``complex128``; ``complex64`` halves memory traffic where full
+    precision is not needed. With CuPy installed, ``backend="cupy"`` keeps the amplitudes on the
+    GPU, where one- and two-qubit gates run as device kernels.
+    """
 
     amplitudes: AmplitudeVector
     num_qubits: int
+    # Cache behind ``probabilities``; slots leave no instance __dict__ for cached_property.
+    _probabilities: Optional[np.ndarray] = field(default=None, init=False, repr=False)
 
     @classmethod
     def from_amplitudes(
-        cls, amplitudes: Iterable[complex], *, normalise: bool = True
+        cls,
+        amplitudes: Iterable[complex],
+        *,
+        normalise: bool = True,
+        dtype: np.dtype | type = np.complex128,
+        backend: StateBackend = "numpy",
     ) -> "QuantumState":
-        vector = tuple(complex(value) for value in amplitudes)
+        if backend not in ("numpy", "cupy"):
+            raise ValueError(f"Unknown state backend '{backend}'.")
+        array = None
+        if isinstance(amplitudes, (np.ndarray, list, tuple)):
+            try:
+                array = np.asarray(amplitudes)
+            except ValueError:  # ragged input; complex() below reports it
+                array = None
+        if array is not None and array.ndim == 1 and array.dtype.kind in "biufc":
+            # Numeric input converts in one call. np.array always copies, so the vector below
+            # is owned here even when ``amplitudes`` is already an array of ``dtype``.
+            vector = np.array(array, dtype=dtype)
+        else:
+            vector = np.array([complex(value) for value in amplitudes], dtype=dtype)
         num_qubits = _validate_dimension(len(vector))
         if normalise:
-            vector = _normalise(vector)
-        return cls(amplitudes=vector, num_qubits=num_qubits)
+            # The vector was built above, so it can be rescaled without another allocation.
+            vector = _normalise(vector, in_place=True)
+        if backend == "cupy":
+            vector = to_device(vector)
+        return cls(amplitudes=_freeze(vector), num_qubits=num_qubits)
 
     @classmethod
     def from_real_imag_pairs(
-        cls, components: Sequence[Sequence[float]], *, normalise: bool = True
+        cls,
+        components: Sequence[Sequence[float]],
+        *,
+        normalise: bool = True,
+        dtype: np.dtype | type = np.complex128,
+        backend: StateBackend = "numpy",
     ) -> "QuantumState":
         vector = amplitudes_from_components(components)
-        return cls.from_amplitudes(vector, normalise=normalise)
+        return cls.from_amplitudes(vector, normalise=normalise, dtype=dtype, backend=backend)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.amplitudes.dtype
+
+    @property
+    def backend(self) -> StateBackend:
+        return "cupy" if is_device_array(self.amplitudes) else "numpy"
+
+    def to_backend(self, backend: StateBackend) -> "QuantumState":
+        """Return this state with its amplitudes moved to host (``"numpy"``) or device memory."""
+
+        if backend not in ("numpy", "cupy"):
+            raise ValueError(f"Unknown state backend '{backend}'.")
+        if backend == self.backend:
+            return self
+        vector = to_device(self.amplitudes) if backend == "cupy" else to_host(self.amplitudes)
+        return QuantumState(amplitudes=_freeze(vector), num_qubits=self.num_qubits)
+
+    def astype(self, dtype: np.dtype | type) -> "QuantumState":
+        """Return this state with amplitudes converted to ``dtype``."""
+
+        if self.amplitudes.dtype == dtype:
+            return self
+        return QuantumState(
+            amplitudes=_freeze(self.amplitudes.astype(dtype)), num_qubits=self.num_qubits
+        )
 
     def distance(self, other: "QuantumState") -> float:
         if self.num_qubits != other.num_qubits:
             raise ValueError("Cannot compare states with different qubit counts.")
-        diff = [self.amplitudes[i] - other.amplitudes[i] for i in range(len(self.amplitudes))]
-        return math.sqrt(sum(abs(value) ** 2 for value in diff))
+        return _distance(self.amplitudes, other.amplitudes)
 
     def apply(self, operation: GateOperation) -> "QuantumState":
+        # Gates are unitary, so the result keeps the norm of this state and is not renormalised.
         new_state = operation.apply(self.amplitudes, self.num_qubits)
-        return QuantumState(amplitudes=new_state, num_qubits=self.num_qubits)
+        return QuantumState(amplitudes=_freeze(new_state), num_qubits=self.num_qubits)
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        """Read-only ``|amplitude|**2`` array, computed on first access."""
+
+        probabilities = self._probabilities
+        if probabilities is None:
+            # re² + im² directly; abs() would take a square root only for it to be squared away.
+            real, imag = self.amplitudes.real, self.amplitudes.imag
+            probabilities = _freeze(real * real + imag * imag)
+            object.__setattr__(self, "_probabilities", probabilities)
+        return probabilities
 
     def as_probability_distribution(self) -> Tuple[float, ...]:
-        return tuple(abs(value) ** 2 for value in self.amplitudes)
+        return tuple(self.probabilities.tolist())
 
     def copy(self) -> "QuantumState":
-        return QuantumState(amplitudes=tuple(self.amplitudes), num_qubits=self.num_qubits)
+        # A host buffer is read-only, so the copy can share it; device buffers are duplicated.
+        amplitudes = self.amplitudes
+        if is_device_array(amplitudes):
+            amplitudes = amplitudes.copy()
+        return QuantumState(amplitudes=amplitudes, num_qubits=self.num_qubits)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QuantumState):
+            return NotImplemented
+        if self.num_qubits != other.num_qubits:
+            return False
+        if self.backend != other.backend:
+            return bool(np.array_equal(to_host(self.amplitudes), to_host(other.amplitudes)))
+        xp = array_module(self.amplitudes)
+        return bool(xp.array_equal(self.amplitudes, other.amplitudes))
+
+    def __hash__(self) -> int:
+        # Consistent with __eq__: complex128 bytes, with -0.0 folded into 0.0 by adding zero.
+        host = to_host(self.amplitudes).astype(np.complex128) + 0.0
+        return hash((self.num_qubits, host.tobytes()))
 
+
+class StateBuffer:
+    """Mutable state vector for replaying gate sequences without per-gate allocations.
+
+    Two preallocated vectors take turns: :meth:`apply` writes the next state into the back
+    vector with :meth:`GateOperation.apply_into` and swaps it to the front. Use it where only
+    the end state matters; :meth:`QuantumState.apply` remains the immutable API.
+    """
+
+    def __init__(self, num_qubits: int, dtype: np.dtype | type = np.complex128) -> None:
+        self.num_qubits = num_qubits
+        self._front = np.empty(2**num_qubits, dtype=dtype)
+        self._back = np.empty_like(self._front)
+
+    def load(self, state: QuantumState) -> None:
+        if state.num_qubits != self.num_qubits:
+            raise ValueError("Cannot load a state with a different qubit count.")
+        self._front[...] = to_host(state.amplitudes)
+
+    def apply(self, operation: GateOperation) -> None:
+        operation.apply_into(self._front, self._back, self.num_qubits)
+        self._front, self._back = self._back, self._front
+
+    def distance(self, other: QuantumState) -> float:
+        if self.num_qubits != other.num_qubits:
+            raise ValueError("Cannot compare states with different qubit counts.")
+        return _distance(self._front, other.amplitudes)
@@ -0,0 +1,68 @@
+"""Optional Numba kernels for quantising and normalising state vectors."""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+else:
+    NUMBA_AVAILABLE = True
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _quantise(parts, scale):
+        """Round ``parts * scale`` to the nearest integer (ties to even) as int64."""
+
+        out = np.empty(parts.shape[0], dtype=np.int64)
+        for i in range(parts.shape[0]):
+            out[i] = np.int64(np.rint(parts[i] * scale))
+        return out
+
+    @njit(cache=True, fastmath=True)
+    def _norm_squared(vector):
+        """Sum of ``|amplitude|**2`` over a complex vector, accumulated in float64."""
+
+        total = 0.0
+        for i in range(vector.shape[0]):
+            value = vector[i]
+            total += value.real * value.real + value.imag * value.imag
+        return total
+
+    @njit(cache=True, fastmath=True)
+    def _distance_squared(first, second):
+        """Sum of ``|first - second|**2`` over two complex vectors, accumulated in float64."""
+
+        total = 0.0
+        for i in range(first.shape[0]):
+            value = first[i] - second[i]
+            total += value.real * value.real + value.imag * value.imag
+        return total
+
+
+def quantise_parts(parts: np.ndarray, scale: int) -> np.ndarray:
+    """Quantise a flat float array of interleaved ``(re, im)`` parts to int64."""
+
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba is not installed; compiled state kernels are unavailable.")
+    return _quantise(parts, scale)
+
+
+def squared_norm(vector: np.ndarray) -> float:
+    """Squared Euclidean norm of a contiguous complex vector."""
+
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba is not installed; compiled state kernels are unavailable.")
+    return float(_norm_squared(vector))
+
+
+def squared_distance(first: np.ndarray, second: np.ndarray) -> float:
+    """Squared Euclidean distance between two complex vectors of equal length."""
+
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("Numba is not installed; compiled state kernels are unavailable.")
+    return float(_distance_squared(first, second))
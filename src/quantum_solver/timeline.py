@@ -2,54 +2,77 @@
 
 from __future__ import annotations
 
-from typing import List, Sequence
+import io
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, TextIO, Tuple
 
-from .gates import GateOperation
+from .gates import SUPPORTED_GATES, Gate, GateOperation
 from .state import QuantumState
 
 
-def _format_amplitude(amplitude: complex, *, precision: int = 6) -> str:
-    return f"{amplitude.real:.{precision}f}{amplitude.imag:+.{precision}f}i"
+@lru_cache(maxsize=8)
+def _state_line_template(width: int, precision: int) -> str:
+    """``str.format`` template for one basis-state line, with the width and precision written in."""
 
-
-def _format_probability(amplitude: complex, *, precision: int = 6) -> str:
-    probability = abs(amplitude) ** 2
-    return f"{probability:.{precision}f}"
+    amplitude = f"{{1.real:.{precision}f}}{{1.imag:+.{precision}f}}i"
+    return f"|{{0:0{width}b}}> amplitude={amplitude}, prob={{2:.{precision}f}}"
 
 
 def format_state(state: QuantumState, *, precision: int = 6) -> List[str]:
-    lines: List[str] = []
-    width = state.num_qubits
-    for index, amplitude in enumerate(state.amplitudes):
-        label = format(index, f"0{width}b")
-        lines.append(
-            f"|{label}> amplitude={_format_amplitude(amplitude, precision=precision)}, "
-            f"prob={_format_probability(amplitude, precision=precision)}"
+    template = _state_line_template(state.num_qubits, precision)
+    # The state caches its probabilities, so a state shown more than once squares them once.
+    return list(
+        map(
+            template.format,
+            range(len(state.amplitudes)),
+            state.amplitudes.tolist(),
+            state.probabilities.tolist(),
         )
-    return lines
+    )
 
 
-def _render_layer_lines(operation: GateOperation, num_qubits: int, width: int = 7) -> List[str]:
+def _gate_marks(operation: GateOperation) -> Dict[int, str]:
+    symbol = operation.gate.name[:1] or "?"
+    return {qubit: symbol for qubit in operation.targets}
+
+
+def _cnot_marks(operation: GateOperation) -> Dict[int, str]:
+    control, target = operation.targets
+    top, bottom = sorted((control, target))
+    marks = {idx: "│" for idx in range(top + 1, bottom)}
+    marks[control] = "●"
+    marks[target] = "X"
+    return marks
+
+
+# Gates drawn differently from a symbol on each target, keyed by the gate object itself.
+_LAYER_MARKS: Dict[Gate, Callable[[GateOperation], Dict[int, str]]] = {
+    SUPPORTED_GATES["CNOT"]: _cnot_marks,
+}
+
+
+@lru_cache(maxsize=8)
+def _wire_template(
+    num_qubits: int, width: int
+) -> Tuple[Tuple[str, ...], str, str, Tuple[str, ...]]:
+    """Wire labels, the wire runs either side of the centre column, and the unmarked lines."""
+
     center = width // 2
-    wires: List[List[str]] = [["─"] * width for _ in range(num_qubits)]
-
-    if operation.gate.num_qubits == 1:
-        target = operation.targets[0]
-        symbol = operation.gate.name[:1] or "?"
-        wires[target][center] = symbol
-    elif operation.gate.name.upper() == "CNOT":
-        control, target = operation.targets
-        top, bottom = sorted((control, target))
-        wires[control][center] = "●"
-        wires[target][center] = "X"
-        for idx in range(top + 1, bottom):
-            wires[idx][center] = "│"
-    else:
-        symbol = operation.gate.name[:1] or "?"
-        for qubit in operation.targets:
-            wires[qubit][center] = symbol
+    labels = tuple(f"q{idx} " for idx in range(num_qubits))
+    left = "─" * center
+    right = "─" * (width - center - 1)
+    blank = left + "─" + right
+    return labels, left, right, tuple(label + blank for label in labels)
 
-    return [f"q{idx} " + "".join(chars) for idx, chars in enumerate(wires)]
+
+def _render_layer_lines(operation: GateOperation, num_qubits: int, width: int = 7) -> List[str]:
+    # Each wire carries at most one mark, in its centre column. The unmarked lines are shared by
+    # every layer of the timeline; only the marked wires are spliced from the two wire runs.
+    labels, left, right, blank_lines = _wire_template(num_qubits, width)
+    lines = list(blank_lines)
+    for idx, mark in _LAYER_MARKS.get(operation.gate, _gate_marks)(operation).items():
+        lines[idx] = f"{labels[idx]}{left}{mark}{right}"
+    return lines
 
 
 def render_timeline(
@@ -59,29 +82,35 @@ def render_timeline(
     intermediate_states: Sequence[QuantumState],
     final_state: QuantumState,
     precision: int = 6,
-) -> str:
-    lines: List[str] = []
-    lines.append("Initial state:")
-    lines.extend(format_state(start, precision=precision))
-    lines.append("")
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    """Render the timeline as text, or write it to ``out`` and return ``None``.
+
+    The text is streamed into ``out`` (or an in-memory buffer) as it is produced, so a long
+    timeline is never held as a list of lines as well as the joined result.
+    """
+
+    buffer = io.StringIO() if out is None else out
+    write = buffer.write
+    write("Initial state:\n")
+    write("\n".join(format_state(start, precision=precision)))
+    write("\n\n")
 
     if not operations:
-        lines.append("Timeline: (no operations)")
-        lines.append("")
-        lines.append("Final state:")
-        lines.extend(format_state(final_state, precision=precision))
-        return "\n".join(lines)
-
-    lines.append("Timeline:")
-    for layer_index, (operation, state) in enumerate(zip(operations, intermediate_states), start=1):
-        lines.append(f"Layer {layer_index}: {operation.describe()}")
-        for wire_line in _render_layer_lines(operation, start.num_qubits):
-            lines.append("    " + wire_line)
-        lines.append("    State after layer {}:".format(layer_index))
-        for state_line in format_state(state, precision=precision):
-            lines.append("        " + state_line)
-        lines.append("")
-
-    lines.append("Final state:")
-    lines.extend(format_state(final_state, precision=precision))
-    return "\n".join(lines)
+        write("Timeline: (no operations)\n\nFinal state:\n")
+    else:
+        write("Timeline:\n")
+        for layer_index, (operation, state) in enumerate(
+            zip(operations, intermediate_states), start=1
+        ):
+            write(f"Layer {layer_index}: {operation.describe()}\n")
+            for wire_line in _render_layer_lines(operation, start.num_qubits):
+                write(f"    {wire_line}\n")
+            write(f"    State after layer {layer_index}:\n")
+            for state_line in format_state(state, precision=precision):
+                write(f"        {state_line}\n")
+            write("\n")
+        write("Final state:\n")
+
+    write("\n".join(format_state(final_state, precision=precision)))
+    return buffer.getvalue() if out is None else None
@@ -3,7 +3,9 @@ import math
 import tempfile
 import unittest
 
-from quantum_solver.gates import GateOperation, SUPPORTED_GATES
+import numpy as np
+
+from quantum_solver.gates import Gate, GateOperation, SUPPORTED_GATES, apply_gate_matrix
 from quantum_solver.solver import GateSequenceSolver
 from quantum_solver.state import QuantumState
 from quantum_solver.timeline import render_timeline
@@ -19,7 +21,9 @@ class GateSequenceSolverTest(unittest.TestCase):
         self.assertEqual(len(result.sequence), 1)
         self.assertAlmostEqual(result.distance, 0.0, places=7)
         self.assertEqual(len(result.states), len(result.sequence))
-        self.assertEqual(result.states[-1].amplitudes, result.final_state.amplitudes)
+        self.assertEqual(
+            result.states[-1].amplitudes.tolist(), result.final_state.amplitudes.tolist()
+        )
 
     def test_two_qubit_bell_state(self) -> None:
         amp = 1.0 / math.sqrt(2.0)
@@ -31,6 +35,60 @@ class GateSequenceSolverTest(unittest.TestCase):
         self.assertLessEqual(len(result.sequence), 2)
         self.assertEqual(len(result.states), len(result.sequence))
 
+    def test_reduced_precision_search_reports_complex128_states(self) -> None:
+        amp = 1.0 / math.sqrt(2.0)
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        target = QuantumState.from_amplitudes([amp, 0.0, 0.0, amp])
+        for search_dtype in (np.complex64, np.complex128):
+            solver = GateSequenceSolver(
+                num_qubits=2, allowed_gates=["H", "CNOT"], search_dtype=search_dtype
+            )
+            result = solver.solve(start, target, max_layers=2)
+            self.assertTrue(result.success)
+            self.assertEqual(result.final_state.dtype, np.complex128)
+            self.assertTrue(all(state.dtype == np.complex128 for state in result.states))
+
+        # Tolerances below float32 resolution are still met by the default complex64 search.
+        deep = start
+        for gate, targets in (("H", (0,)), ("T", (0,)), ("H", (0,)), ("CNOT", (0, 1)), ("T", (1,))):
+            deep = deep.apply(GateOperation(gate=SUPPORTED_GATES[gate], targets=targets))
+        deep = deep.apply(GateOperation(gate=SUPPORTED_GATES["H"], targets=(1,)))
+        strict = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "T", "CNOT"], tolerance=1e-8)
+        result = strict.solve(start, deep, max_layers=6)
+        self.assertTrue(result.success)
+        self.assertLessEqual(result.distance, 1e-8)
+
+        single = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "CNOT"])
+        result = single.solve(
+            start.astype(np.complex64), target.astype(np.complex64), max_layers=2
+        )
+        self.assertTrue(result.success)
+        self.assertEqual(result.final_state.dtype, np.complex128)
+        self.assertTrue(all(state.dtype == np.complex128 for state in result.states))
+
+    def test_unnormalised_states_use_their_own_norm(self) -> None:
+        from unittest import mock
+
+        amp = 1.0 / math.sqrt(2.0)
+        start = QuantumState.from_amplitudes([2.0, 0.0, 0.0, 0.0], normalise=False)
+        target = QuantumState.from_amplitudes([2 * amp, 0.0, 0.0, 2 * amp], normalise=False)
+        solver = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "T", "CNOT"])
+        for bidirectional in (False, True):
+            result = solver.solve(start, target, max_layers=3, bidirectional=bidirectional)
+            self.assertTrue(result.success)
+            self.assertEqual(result.layers_used, 2)
+            self.assertLessEqual(result.distance, solver.tolerance)
+
+        # The reach bound must stay sound for longer vectors: it may not lose the best state.
+        far = QuantumState.from_amplitudes([0.0, 1.0, 0.0, 3.0], normalise=False)
+        unbounded = staticmethod(lambda layer_operations: [math.inf] * (len(layer_operations) + 1))
+        result = solver.solve(start, far, max_layers=3)
+        with mock.patch.object(GateSequenceSolver, "_remaining_reach", unbounded):
+            reference = solver.solve(start, far, max_layers=3)
+        self.assertFalse(result.success)
+        self.assertAlmostEqual(result.distance, reference.distance, places=12)
+        self.assertAlmostEqual(result.distance, result.final_state.distance(far), places=12)
+
     def test_failure_when_layers_too_small(self) -> None:
         amp = 1.0 / math.sqrt(2.0)
         start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
@@ -63,6 +121,33 @@ class GateSequenceSolverTest(unittest.TestCase):
             self.assertEqual(amplitudes[0], [0.0, 0.0])
             self.assertEqual(amplitudes[1], [1.0, 0.0])
 
+    def test_result_payload_can_omit_steps(self) -> None:
+        from quantum_solver.persistence import result_to_payload
+
+        start = QuantumState.from_amplitudes([1.0, 0.0])
+        target = QuantumState.from_amplitudes([0.0, 1.0])
+        solver = GateSequenceSolver(num_qubits=1, allowed_gates=["X"])
+        result = solver.solve(start, target, max_layers=1)
+
+        payload = result_to_payload(result, include_steps=False)
+        self.assertNotIn("steps", payload)
+        self.assertEqual(payload["sequence"], [{"gate": "X", "targets": [0]}])
+        self.assertEqual(payload["final_state"]["amplitudes"][1], [1.0, 0.0])
+
+    def test_result_payload_flat_amplitudes_without_legacy_pairs(self) -> None:
+        from quantum_solver.persistence import dumps_payload, result_to_payload
+
+        start = QuantumState.from_amplitudes([1.0, 0.0])
+        target = QuantumState.from_amplitudes([0.0, 1.0])
+        solver = GateSequenceSolver(num_qubits=1, allowed_gates=["X"])
+        result = solver.solve(start, target, max_layers=1)
+
+        payload = json.loads(dumps_payload(result_to_payload(result, legacy=False)))
+        final_state = payload["final_state"]
+        self.assertNotIn("amplitudes", final_state)
+        self.assertEqual(final_state["flat_amplitudes"], [0.0, 0.0, 1.0, 0.0])
+        self.assertEqual(payload["steps"][0]["state"]["flat_amplitudes"], [0.0, 0.0, 1.0, 0.0])
+
     def test_render_timeline_no_operations(self) -> None:
         state = QuantumState.from_amplitudes([1.0, 0.0])
         timeline = render_timeline(
@@ -91,6 +176,172 @@ class GateSequenceSolverTest(unittest.TestCase):
         self.assertIn("CNOT q0->q1", timeline)
         self.assertIn("Final state:", timeline)
 
+        import io
+
+        stream = io.StringIO()
+        self.assertIsNone(
+            render_timeline(
+                start,
+                result.sequence,
+                intermediate_states=result.states,
+                final_state=result.final_state,
+                out=stream,
+            )
+        )
+        self.assertEqual(stream.getvalue(), timeline)
+
+    def test_bidirectional_search_matches_forward_search_length(self) -> None:
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        target = start
+        for gate, targets in (("H", (0,)), ("T", (0,)), ("CNOT", (0, 1)), ("H", (1,)), ("S", (1,))):
+            target = target.apply(GateOperation(gate=SUPPORTED_GATES[gate], targets=targets))
+        solver = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "T", "S", "CNOT"])
+        forward = solver.solve(start, target, max_layers=6)
+        bidirectional = solver.solve(start, target, max_layers=6, bidirectional=True)
+        self.assertTrue(bidirectional.success)
+        self.assertEqual(bidirectional.layers_used, forward.layers_used)
+        self.assertLessEqual(bidirectional.final_state.distance(target), 1e-6)
+
+        fixed = {0: GateOperation(gate=SUPPORTED_GATES["H"], targets=(0,))}
+        constrained = GateSequenceSolver(num_qubits=2, allowed_gates=["H"], fixed_operations=fixed)
+        with self.assertRaises(ValueError):
+            constrained.solve(start, target, max_layers=6, bidirectional=True)
+
+    def test_bidirectional_search_accepts_targets_off_the_gate_grid(self) -> None:
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        exact = start
+        for gate, targets in (("H", (0,)), ("CNOT", (0, 1)), ("T", (1,)), ("H", (1,))):
+            exact = exact.apply(GateOperation(gate=SUPPORTED_GATES[gate], targets=targets))
+        # Rounded amplitudes sit within tolerance of the exact state but match no reachable key.
+        target = QuantumState.from_amplitudes(np.round(exact.amplitudes, 4))
+        solver = GateSequenceSolver(
+            num_qubits=2, allowed_gates=["H", "T", "S", "CNOT"], tolerance=1e-3
+        )
+        forward = solver.solve(start, target, max_layers=5)
+        bidirectional = solver.solve(start, target, max_layers=5, bidirectional=True)
+        self.assertTrue(forward.success)
+        self.assertTrue(bidirectional.success)
+        self.assertEqual(bidirectional.layers_used, forward.layers_used)
+        self.assertLessEqual(bidirectional.distance, 1e-3)
+
+        one_qubit = GateSequenceSolver(
+            num_qubits=1, allowed_gates=["H", "T", "S"], search_dtype=np.complex128
+        )
+        amp = 1.0 / math.sqrt(2.0)
+        nudged = QuantumState.from_amplitudes([amp + 3e-7, amp - 3e-7])
+        result = one_qubit.solve(
+            QuantumState.from_amplitudes([1.0, 0.0]), nudged, max_layers=3, bidirectional=True
+        )
+        self.assertTrue(result.success)
+        self.assertEqual(result.layers_used, 1)
+
+    def test_visited_set_reports_new_keys_across_growth(self) -> None:
+        from quantum_solver.solver import _VisitedSet
+
+        visited = _VisitedSet(capacity=8)
+        seen: set[int] = set()
+        rng = np.random.default_rng(1)
+        for _ in range(20):
+            # Few distinct values force repeats within and across batches and colliding slots.
+            keys = rng.integers(0, 200, size=40).astype(np.uint64) << np.uint64(3)
+            expected = []
+            for key in keys.tolist():
+                expected.append(key not in seen)
+                seen.add(key)
+            self.assertEqual(visited.insert(keys).tolist(), expected)
+        self.assertEqual(len(visited), len(seen))
+
+    def test_commutation_pruning_keeps_minimal_depth(self) -> None:
+        from unittest import mock
+
+        def unpruned(self, operations):
+            positions = {operation: index for index, operation in enumerate(operations)}
+            return positions, np.zeros((len(operations) + 1, len(operations)), dtype=bool)
+
+        def placed(gate, *targets):
+            return GateOperation(gate=SUPPORTED_GATES[gate], targets=targets)
+
+        # Disjoint-qubit pairs and diagonal pairs on one qubit, in both orders.
+        sequences = [
+            [placed("H", 0), placed("H", 1)],
+            [placed("H", 1), placed("H", 0), placed("T", 1)],
+            [placed("T", 0), placed("H", 1), placed("S", 0)],
+            [placed("H", 0), placed("S", 0), placed("T", 0), placed("CNOT", 0, 1)],
+        ]
+        rng = np.random.default_rng(7)
+        solver = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "T", "S", "CNOT"])
+        operations = solver.operations
+        for _ in range(6):
+            picks = rng.integers(len(operations), size=int(rng.integers(2, 5)))
+            sequences.append([operations[index] for index in picks])
+
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        for sequence in sequences:
+            target = start
+            for operation in sequence:
+                target = target.apply(operation)
+            pruned = solver.solve(start, target, max_layers=5)
+            with mock.patch.object(GateSequenceSolver, "_prune_table", unpruned):
+                reference = solver.solve(start, target, max_layers=5)
+            self.assertTrue(reference.success)
+            self.assertTrue(pruned.success)
+            self.assertEqual(pruned.layers_used, reference.layers_used)
+            self.assertLessEqual(pruned.distance, solver.tolerance)
+
+    def test_unconfirmed_candidate_is_still_expanded(self) -> None:
+        from unittest import mock
+
+        confirm = GateSequenceSolver._reaches_target
+        calls: list[int] = []
+
+        def reject_first(self, *args):
+            calls.append(len(calls))
+            return len(calls) > 1 and confirm(self, *args)
+
+        start = QuantumState.from_amplitudes([1.0, 0.0])
+        target = QuantumState.from_amplitudes([0.0, 1.0])
+        solver = GateSequenceSolver(num_qubits=1, allowed_gates=["X"])
+        # X is the only way forward, so the search continues only through the rejected child.
+        with mock.patch.object(GateSequenceSolver, "_reaches_target", reject_first):
+            result = solver.solve(start, target, max_layers=3)
+        self.assertTrue(result.success)
+        self.assertEqual(result.layers_used, 3)
+
+    def test_reach_bound_keeps_last_layer_solutions_and_best_distance(self) -> None:
+        from unittest import mock
+        from quantum_solver.solver import _Frontier
+
+        unbounded = staticmethod(lambda layer_operations: [math.inf] * (len(layer_operations) + 1))
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        target = start
+        for gate, targets in (("H", (0,)), ("T", (0,)), ("H", (0,)), ("CNOT", (0, 1)), ("T", (1,))):
+            target = target.apply(GateOperation(gate=SUPPORTED_GATES[gate], targets=targets))
+        solver = GateSequenceSolver(num_qubits=2, allowed_gates=["H", "T", "CNOT"])
+        # The target needs all five layers, so only the last layer's children can reach it.
+        self.assertFalse(solver.solve(start, target, max_layers=4).success)
+        result = solver.solve(start, target, max_layers=5)
+        self.assertTrue(result.success)
+        self.assertEqual(result.layers_used, 5)
+
+        rng = np.random.default_rng(3)
+        unreachable = QuantumState.from_amplitudes(rng.normal(size=4) + 1j * rng.normal(size=4))
+        push = _Frontier.push
+        depths: list[int] = []
+
+        def record(self, vector, node_id, depth):
+            depths.append(depth)
+            push(self, vector, node_id, depth)
+
+        # Children of the last layer are scored but never enqueued for expansion.
+        with mock.patch.object(_Frontier, "push", record):
+            bounded = solver.solve(start, unreachable, max_layers=4)
+        self.assertEqual(max(depths), 3)
+        with mock.patch.object(GateSequenceSolver, "_remaining_reach", unbounded):
+            reference = solver.solve(start, unreachable, max_layers=4)
+        self.assertFalse(bounded.success)
+        self.assertAlmostEqual(bounded.distance, reference.distance, places=12)
+        self.assertEqual(bounded.layers_used, reference.layers_used)
+
     def test_fixed_gate_requires_compensation(self) -> None:
         start = QuantumState.from_amplitudes([1.0, 0.0])
         target = QuantumState.from_amplitudes([1.0, 0.0])
@@ -101,7 +352,7 @@ class GateSequenceSolverTest(unittest.TestCase):
         self.assertEqual(len(result.sequence), 2)
         self.assertEqual([op.gate.name for op in result.sequence], ["X", "X"])
         self.assertAlmostEqual(result.distance, 0.0, places=7)
-        self.assertEqual(result.final_state.amplitudes, target.amplitudes)
+        self.assertEqual(result.final_state.amplitudes.tolist(), target.amplitudes.tolist())
 
     def test_fixed_gate_beyond_max_layers_raises(self) -> None:
         start = QuantumState.from_amplitudes([1.0, 0.0])
@@ -131,7 +382,9 @@ class GateSequenceSolverTest(unittest.TestCase):
         result = solver.solve(start, target, max_layers=7)
         self.assertTrue(result.success)
         self.assertEqual(len(result.sequence), 7)
-        self.assertEqual([op.gate.name for op in result.sequence[:6]], ["H", "S", "S", "S", "S", "Z"])
+        self.assertEqual(
+            [op.gate.name for op in result.sequence[:6]], ["H", "S", "S", "S", "S", "Z"]
+        )
         self.assertEqual(result.sequence[6].gate.name, "H")
         self.assertAlmostEqual(result.distance, 0.0, places=7)
         final = result.final_state.amplitudes
@@ -197,6 +450,158 @@ class GateSequenceSolverTest(unittest.TestCase):
                 layer_gate_allowlists=layer_constraints,
             )
 
+    def test_apply_gate_matrix_matches_kronecker_product(self) -> None:
+        rng = np.random.default_rng(7)
+        state = rng.normal(size=8) + 1j * rng.normal(size=8)
+        cnot = np.asarray(SUPPORTED_GATES["CNOT"].matrix)
+        identity = np.eye(2)
+        # Control on qubit 2 (most significant bit), target on qubit 0.
+        swap_01 = np.eye(8)[[0, 2, 1, 3, 4, 6, 5, 7]]
+        expected = swap_01 @ np.kron(cnot, identity) @ swap_01 @ state
+        result = apply_gate_matrix(state, cnot, (2, 0), 3)
+        np.testing.assert_allclose(result, expected)
+
+    def test_gate_operation_apply_matches_reference_contraction(self) -> None:
+        rng = np.random.default_rng(11)
+        state = rng.normal(size=8) + 1j * rng.normal(size=8)
+        for gate in SUPPORTED_GATES.values():
+            if gate.num_qubits == 1:
+                targets_options = [(0,), (1,), (2,)]
+            else:
+                targets_options = [(0, 2), (2, 1), (1, 0)]
+            for targets in targets_options:
+                operation = GateOperation(gate=gate, targets=targets)
+                expected = apply_gate_matrix(state, gate.matrix, targets, 3)
+                np.testing.assert_allclose(operation.apply(state, 3), expected, atol=1e-12)
+
+    def test_gate_operation_unitary_matches_apply(self) -> None:
+        rng = np.random.default_rng(13)
+        state = rng.normal(size=8) + 1j * rng.normal(size=8)
+        operation = GateOperation(gate=SUPPORTED_GATES["CNOT"], targets=(2, 0))
+        unitary = operation.unitary(3)
+        self.assertEqual(unitary.shape, (8, 8))
+        np.testing.assert_allclose(unitary @ state, operation.apply(state, 3), atol=1e-12)
+
+    def test_gate_operation_apply_into_writes_output_buffer(self) -> None:
+        rng = np.random.default_rng(17)
+        states = (rng.normal(size=(4, 8)) + 1j * rng.normal(size=(4, 8))).astype(np.complex64)
+        for gate in SUPPORTED_GATES.values():
+            targets = (1,) if gate.num_qubits == 1 else (2, 0)
+            operation = GateOperation(gate=gate, targets=targets)
+            out = np.empty_like(states)
+            self.assertIs(operation.apply_into(states, out, 3), out)
+            np.testing.assert_allclose(out, operation.apply_batch(states, 3), atol=1e-6)
+        with self.assertRaises(ValueError):
+            operation.apply_into(states, states, 3)
+
+    def test_single_vectors_use_compiled_kernels_with_numba(self) -> None:
+        from unittest import mock
+        from quantum_solver import kernels
+        from quantum_solver.gates_numba import NUMBA_AVAILABLE
+
+        if not NUMBA_AVAILABLE:
+            self.skipTest("numba is not installed")
+        rng = np.random.default_rng(5)
+        state = rng.normal(size=8) + 1j * rng.normal(size=8)
+        controlled_z = Gate(name="CZ", matrix=np.diag([1, 1, 1, -1]).astype(complex), num_qubits=2)
+        placements = (
+            (SUPPORTED_GATES["H"], (1,)),
+            (SUPPORTED_GATES["T"], (2,)),
+            (controlled_z, (2, 0)),
+        )
+        for gate, targets in placements:
+            expected = apply_gate_matrix(state, gate.matrix, targets, 3)
+            kernels._kernel_cache.pop((gate, targets, 3), None)
+            with mock.patch.object(
+                kernels, "apply_small_gate", wraps=kernels.apply_small_gate
+            ) as compiled:
+                operation = GateOperation(gate=gate, targets=targets)
+                np.testing.assert_allclose(operation.apply(state, 3), expected, atol=1e-12)
+                out = np.empty_like(state)
+                self.assertIs(operation.apply_into(state, out, 3), out)
+            np.testing.assert_allclose(out, expected, atol=1e-12)
+            self.assertEqual(compiled.call_count, 2)
+
+    def test_state_buffer_replays_sequence_like_apply(self) -> None:
+        from quantum_solver.state import StateBuffer
+
+        start = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        sequence = [
+            GateOperation(gate=SUPPORTED_GATES["H"], targets=(0,)),
+            GateOperation(gate=SUPPORTED_GATES["T"], targets=(0,)),
+            GateOperation(gate=SUPPORTED_GATES["CNOT"], targets=(0, 1)),
+        ]
+        expected = start
+        buffer = StateBuffer(num_qubits=2)
+        buffer.load(start)
+        for operation in sequence:
+            expected = expected.apply(operation)
+            buffer.apply(operation)
+        self.assertEqual(buffer.distance(expected), 0.0)
+        self.assertGreater(buffer.distance(start), 0.5)
+
+    def test_state_backend_selection(self) -> None:
+        from quantum_solver.gates_cupy import CUPY_AVAILABLE
+
+        state = QuantumState.from_amplitudes([1.0, 0.0, 0.0, 0.0])
+        self.assertEqual(state.backend, "numpy")
+        self.assertIs(state.to_backend("numpy"), state)
+        with self.assertRaises(ValueError):
+            QuantumState.from_amplitudes([1.0, 0.0], backend="torch")
+        if not CUPY_AVAILABLE:
+            with self.assertRaises(RuntimeError):
+                state.to_backend("cupy")
+            return
+        device = state.to_backend("cupy")
+        for gate, targets in (("H", (0,)), ("T", (0,)), ("CNOT", (0, 1))):
+            operation = GateOperation(gate=SUPPORTED_GATES[gate], targets=targets)
+            state, device = state.apply(operation), device.apply(operation)
+        self.assertEqual(device.backend, "cupy")
+        self.assertLessEqual(device.distance(state), 1e-12)
+
+    def test_states_hash_by_value(self) -> None:
+        first = QuantumState.from_amplitudes([1.0, 0.0])
+        same = QuantumState.from_amplitudes([1.0, -0.0])
+        other = QuantumState.from_amplitudes([0.0, 1.0])
+        self.assertEqual(first, same)
+        self.assertEqual(hash(first), hash(same))
+        self.assertEqual(len({first, same, other}), 2)
+        self.assertEqual({first: "zero"}[first.astype(np.complex64)], "zero")
+
+    def test_unit_norm_tolerance_follows_precision(self) -> None:
+        scale = math.sqrt(1.0 + 4e-6)
+        amplitudes = [scale * math.sqrt(0.5), 0.0, scale * math.sqrt(0.5), 0.0]
+        single = QuantumState.from_amplitudes(amplitudes, dtype=np.complex64)
+        double = QuantumState.from_amplitudes(amplitudes, dtype=np.complex128)
+        # Both precisions are rescaled; complex64 lands within a few float32 epsilons of one.
+        wide = single.amplitudes.astype(np.complex128)
+        epsilon = float(np.finfo(np.float32).eps)
+        self.assertLessEqual(abs(float(np.vdot(wide, wide).real) - 1.0), 4 * epsilon)
+        self.assertAlmostEqual(float(np.vdot(double.amplitudes, double.amplitudes).real), 1.0, 12)
+
+    def test_load_config_rereads_modified_file(self) -> None:
+        import os
+        from pathlib import Path
+        from quantum_solver.cli import _load_config
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.json"
+            path.write_text(json.dumps({"num_qubits": 1}))
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+            self.assertEqual(_load_config(str(path)), {"num_qubits": 1})
+
+            path.write_text(json.dumps({"num_qubits": 2}))
+            os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+            self.assertEqual(_load_config(str(path)), {"num_qubits": 2})
+
+    def test_load_config_reads_text_stdin(self) -> None:
+        import io
+        from unittest import mock
+        from quantum_solver.cli import _load_config
+
+        with mock.patch("sys.stdin", io.StringIO('{"num_qubits": 3}')):
+            self.assertEqual(_load_config("-"), {"num_qubits": 3})
+
 
 if __name__ == "__main__":
     unittest.main()